@@ -18,10 +18,18 @@ For async usage::
         async with AetherAsyncClient("http://localhost:3000") as client:
             await client.login("admin", "password")
             agents = await client.agents.list()
+
+For maximum async throughput, call :func:`install_uvloop` before starting
+the event loop, or set ``AETHER_USE_UVLOOP=1`` to have importing the
+package do it.
 """
 
 from __future__ import annotations
 
+import asyncio
+import os
+import sys
+
 from aether.client import AetherClient
 from aether.async_client import AetherAsyncClient
 from aether.exceptions import AetherError
@@ -30,6 +38,44 @@ __all__ = [
     "AetherClient",
     "AetherAsyncClient",
     "AetherError",
+    "install_uvloop",
 ]
 
+
+def install_uvloop() -> bool:
+    """Make new asyncio event loops use uvloop (or winloop on Windows).
+
+    uvloop's libuv-based loop has considerably lower per-call overhead than
+    the stock asyncio loop, which matters for request-heavy
+    :class:`AetherAsyncClient` workloads. The policy only applies to loops
+    created afterwards, so call this before :func:`asyncio.run`::
+
+        import aether
+
+        aether.install_uvloop()
+        asyncio.run(main())
+
+    Requires the ``uvloop`` extra. Does nothing when neither package is
+    installed.
+
+    Returns:
+        ``True`` if an alternative event loop policy was installed.
+    """
+    try:
+        if sys.platform == "win32":
+            import winloop as loop_impl  # type: ignore[import-not-found]
+        else:
+            import uvloop as loop_impl  # type: ignore[import-not-found]
+    except ImportError:
+        return False
+    # ``install()`` is deprecated on Python 3.12+; setting the policy
+    # directly is equivalent and warning-free on every version.
+    asyncio.set_event_loop_policy(loop_impl.EventLoopPolicy())
+    return True
+
+
+# Lets deployments opt in without touching the application's entry point.
+if os.environ.get("AETHER_USE_UVLOOP") == "1":
+    install_uvloop()
+
 __version__ = "0.4.0"
@@ -0,0 +1,130 @@
+"""aiohttp-backed transport for the asynchronous client.
+
+Plugs into :class:`httpx.AsyncClient` as a custom transport so request
+building, default headers and response handling stay shared with the
+default backend, while connection management and HTTP parsing are done by
+aiohttp's compiled protocol implementation instead of ``httpcore``/``anyio``.
+
+Selected with ``AetherAsyncClient(..., transport="aiohttp")``; requires the
+``aiohttp`` extra.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any, AsyncIterator
+
+import httpx
+
+try:
+    import aiohttp
+except ImportError as exc:  # pragma: no cover - depends on the environment
+    raise ImportError(
+        "The aiohttp transport requires the 'aiohttp' extra: "
+        'pip install "aether-os-sdk[aiohttp]"'
+    ) from exc
+
+
+class _AiohttpResponseStream(httpx.AsyncByteStream):
+    """Expose an aiohttp response body as an httpx byte stream."""
+
+    def __init__(
+        self, response: aiohttp.ClientResponse, request: httpx.Request
+    ) -> None:
+        self._response = response
+        self._request = request
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        try:
+            async for chunk in self._response.content.iter_any():
+                yield chunk
+        except asyncio.TimeoutError as exc:
+            raise httpx.ReadTimeout(
+                str(exc) or "Read timed out", request=self._request
+            ) from exc
+        except aiohttp.ClientError as exc:
+            raise httpx.ReadError(str(exc), request=self._request) from exc
+
+    async def aclose(self) -> None:
+        self._response.release()
+
+
+class _AiohttpTransport(httpx.AsyncBaseTransport):
+    """:class:`httpx.AsyncBaseTransport` that sends requests with aiohttp.
+
+    The :class:`aiohttp.ClientSession` is created lazily on the first request
+    because it must be bound to the running event loop.
+
+    Args:
+        limits: Connection pool limits, mapped onto aiohttp's
+            :class:`~aiohttp.TCPConnector`.
+    """
+
+    def __init__(self, *, limits: httpx.Limits) -> None:
+        self._limits = limits
+        self._session: aiohttp.ClientSession | None = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None:
+            connector_kwargs: dict[str, Any] = {
+                "limit": self._limits.max_connections or 0,
+            }
+            if self._limits.keepalive_expiry is not None:
+                connector_kwargs["keepalive_timeout"] = self._limits.keepalive_expiry
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(**connector_kwargs),
+                # httpx decodes Content-Encoding itself; decoding here too
+                # would corrupt compressed bodies.
+                auto_decompress=False,
+                # Honour HTTP(S)_PROXY/NO_PROXY like the httpx transport.
+                trust_env=True,
+            )
+        return self._session
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        timeouts = request.extensions.get("timeout", {})
+        timeout = aiohttp.ClientTimeout(
+            total=None,
+            connect=timeouts.get("pool"),
+            sock_connect=timeouts.get("connect"),
+            sock_read=timeouts.get("read"),
+        )
+        try:
+            response = await self._get_session().request(
+                request.method,
+                str(request.url),
+                headers=request.headers.multi_items(),
+                data=await request.aread() or None,
+                timeout=timeout,
+                allow_redirects=False,
+            )
+        except aiohttp.ConnectionTimeoutError as exc:
+            raise httpx.ConnectTimeout(
+                str(exc) or "Connect timed out", request=request
+            ) from exc
+        except asyncio.TimeoutError as exc:
+            # Any other timeout here is ``sock_read`` expiring while waiting
+            # for the response headers.
+            raise httpx.ReadTimeout(
+                str(exc) or "Read timed out", request=request
+            ) from exc
+        except aiohttp.ClientConnectionError as exc:
+            raise httpx.ConnectError(str(exc), request=request) from exc
+        except aiohttp.ClientError as exc:
+            raise httpx.TransportError(str(exc), request=request) from exc
+
+        version = response.version or aiohttp.HttpVersion11
+        return httpx.Response(
+            status_code=response.status,
+            headers=list(response.raw_headers),
+            stream=_AiohttpResponseStream(response, request),
+            extensions={
+                "http_version": f"HTTP/{version.major}.{version.minor}".encode(),
+                "reason_phrase": (response.reason or "").encode(),
+            },
+        )
+
+    async def aclose(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
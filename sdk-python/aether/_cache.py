@@ -0,0 +1,106 @@
+"""Client-side response caches for idempotent GET requests."""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from typing import Any, Hashable
+
+import httpx
+
+_Key = Hashable
+_MISSING: Any = object()
+# Request headers for a GET that must not be answered from any cache.
+_NO_CACHE = {"Cache-Control": "no-cache"}
+
+
+def cache_key(path: str, params: dict[str, Any] | None) -> _Key:
+    """Return the cache key for a GET of ``path`` with ``params``."""
+    if not params:
+        return path
+    return (path, tuple(sorted(params.items())))
+
+
+class _ETagCache:
+    """Bounded LRU of ``(etag, parsed body)`` pairs for conditional GETs.
+
+    Entries are keyed by request path and query parameters. When a cached
+    entry exists, the request carries ``If-None-Match`` and a ``304 Not
+    Modified`` reply is answered from the cache without transferring or
+    decoding the body again.
+
+    Args:
+        maxsize: Maximum number of responses kept; the least recently used
+            entry is evicted first.
+    """
+
+    __slots__ = ("_entries", "_maxsize")
+
+    def __init__(self, maxsize: int) -> None:
+        self._entries: OrderedDict[_Key, tuple[str, Any]] = OrderedDict()
+        self._maxsize = maxsize
+
+    def lookup(self, key: _Key) -> tuple[dict[str, str] | None, tuple[str, Any] | None]:
+        """Return the conditional request headers and cached entry for ``key``."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None, None
+        self._entries.move_to_end(key)
+        return {"If-None-Match": entry[0]}, entry
+
+    def store(self, key: _Key, response: httpx.Response, data: Any) -> None:
+        """Remember ``data`` under ``key`` if ``response`` carries an ETag."""
+        etag = response.headers.get("ETag")
+        if etag is None:
+            return
+        entries = self._entries
+        entries[key] = (etag, data)
+        entries.move_to_end(key)
+        if len(entries) > self._maxsize:
+            entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every cached response."""
+        self._entries.clear()
+
+
+class _TTLCache:
+    """Bounded cache of parsed GET responses that expire after ``ttl`` seconds.
+
+    Backs the ``cache=True`` option of read-mostly namespace methods: a hit
+    skips the network round trip entirely.
+
+    Args:
+        maxsize: Maximum number of responses kept; the oldest entry is
+            evicted first.
+        ttl: Seconds a response stays fresh.
+    """
+
+    __slots__ = ("_entries", "_maxsize", "_ttl")
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self._entries: OrderedDict[_Key, tuple[float, Any]] = OrderedDict()
+        self._maxsize = maxsize
+        self._ttl = ttl
+
+    def get(self, key: _Key) -> Any:
+        """Return the fresh value for ``key``, or ``_MISSING``."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return _MISSING
+        if entry[0] <= time.monotonic():
+            del self._entries[key]
+            return _MISSING
+        return entry[1]
+
+    def set(self, key: _Key, value: Any) -> None:
+        """Store ``value`` under ``key`` for ``ttl`` seconds."""
+        entries = self._entries
+        entries[key] = (time.monotonic() + self._ttl, value)
+        entries.move_to_end(key)
+        if len(entries) > self._maxsize:
+            entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every cached response."""
+        self._entries.clear()
@@ -0,0 +1,34 @@
+"""JSON codec selection for the Aether OS SDK.
+
+Uses :mod:`orjson` when the ``fast`` extra is installed and falls back to
+the standard library otherwise. Both decoders accept ``bytes`` directly,
+so response bodies are parsed without an intermediate ``str`` copy, and
+request bodies are encoded straight to ``bytes``.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Callable
+
+loads: Callable[[bytes | str], Any]
+dumps: Callable[[Any], bytes]
+
+try:
+    import orjson
+
+    loads = orjson.loads
+    dumps = orjson.dumps
+except ImportError:  # pragma: no cover - exercised only without the extra
+    loads = json.loads
+
+    def dumps(obj: Any) -> bytes:
+        """Encode ``obj`` compactly as UTF-8, matching httpx's ``json=``."""
+        return json.dumps(
+            obj, ensure_ascii=False, separators=(",", ":"), allow_nan=False
+        ).encode("utf-8")
+
+# Headers sent with every encoded request body.
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+__all__ = ["JSON_HEADERS", "dumps", "loads"]
@@ -0,0 +1,87 @@
+"""Response handling shared by the synchronous and asynchronous clients."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import httpx
+
+from aether._json import loads
+from aether.exceptions import AetherError
+
+
+def handle_response(response: httpx.Response) -> Any:
+    """Process an HTTP response, raising on errors.
+
+    On success, returns the ``data`` member if the body contains one,
+    otherwise the full parsed JSON. The body is decoded straight from
+    ``response.content`` with the fastest available JSON codec.
+    ``204 No Content`` and empty bodies return ``None`` without parsing.
+
+    Raises:
+        AetherError: If the server returns a non-2xx status.
+    """
+    status = response.status_code
+    if not 200 <= status < 300:
+        raise _error_from(response, status)
+
+    content = response.content
+    if status == 204 or not content:
+        return None
+
+    data = loads(content)
+    if isinstance(data, dict) and "data" in data:
+        return data["data"]
+    return data
+
+
+def handle_response_as(response: httpx.Response, type: Any) -> Any:
+    """Like :func:`handle_response`, but decode ``data`` into ``type``.
+
+    The body goes straight from bytes to the msgspec structs of
+    :mod:`aether.models`. ``204 No Content`` and empty bodies return
+    ``None``, as they do for dict responses.
+
+    Raises:
+        AetherError: If the server returns a non-2xx status or a body that
+            does not decode into ``type``.
+    """
+    from aether.models import DecodeError, decode_data
+
+    status = response.status_code
+    if not 200 <= status < 300:
+        raise _error_from(response, status)
+
+    content = response.content
+    if status == 204 or not content:
+        return None
+
+    try:
+        return decode_data(content, type)
+    except DecodeError as exc:
+        raise AetherError(
+            f"Invalid response body: {exc}",
+            code="INVALID_RESPONSE",
+            status=status,
+        ) from exc
+
+
+def _error_from(response: httpx.Response, status: int) -> AetherError:
+    """Build an :class:`AetherError` from a non-2xx response."""
+    try:
+        parsed = loads(response.content)
+    except ValueError:
+        parsed = None
+
+    err = parsed.get("error") if isinstance(parsed, dict) else None
+    if isinstance(err, dict):
+        message = err.get("message")
+        code = err.get("code")
+    else:
+        message = code = None
+
+    return AetherError(
+        message or f"HTTP {status}: {response.reason_phrase}",
+        code=code or f"HTTP_{status}",
+        status=status,
+    )
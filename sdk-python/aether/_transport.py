@@ -7,16 +7,27 @@ not instantiated at runtime.
 
 from __future__ import annotations
 
-from typing import Any, Protocol
+from typing import Any, Awaitable, Protocol
 
 
 class SyncTransport(Protocol):
     """Protocol for synchronous HTTP transport methods."""
 
-    def _get(self, path: str, *, params: dict[str, Any] | None = None) -> Any: ...
+    def _get(
+        self,
+        path: str,
+        *,
+        params: dict[str, Any] | None = None,
+        cache: bool = False,
+        no_cache: bool = False,
+    ) -> Any: ...
+
+    def _get_as(self, path: str, type: Any) -> Any: ...
 
     def _post(self, path: str, *, json: Any | None = None) -> Any: ...
 
+    def _post_raw(self, path: str, *, content: bytes) -> Any: ...
+
     def _put(self, path: str, *, json: Any) -> Any: ...
 
     def _patch(self, path: str, *, json: Any) -> Any: ...
@@ -27,12 +38,30 @@ class SyncTransport(Protocol):
 class AsyncTransport(Protocol):
     """Protocol for asynchronous HTTP transport methods."""
 
-    async def _get(self, path: str, *, params: dict[str, Any] | None = None) -> Any: ...
+    async def _get(
+        self,
+        path: str,
+        *,
+        params: dict[str, Any] | None = None,
+        cache: bool = False,
+        no_cache: bool = False,
+    ) -> Any: ...
+
+    async def _get_as(self, path: str, type: Any) -> Any: ...
 
     async def _post(self, path: str, *, json: Any | None = None) -> Any: ...
 
+    async def _post_raw(self, path: str, *, content: bytes) -> Any: ...
+
     async def _put(self, path: str, *, json: Any) -> Any: ...
 
     async def _patch(self, path: str, *, json: Any) -> Any: ...
 
     async def _delete(self, path: str) -> Any: ...
+
+    async def gather(
+        self,
+        *aws: Awaitable[Any],
+        return_exceptions: bool = False,
+        max_concurrency: int | None = None,
+    ) -> list[Any]: ...
@@ -6,52 +6,181 @@ REST API v1 using :mod:`httpx` with ``AsyncClient``.
 
 from __future__ import annotations
 
-from typing import Any, AsyncIterator
+import asyncio
+import importlib
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Hashable,
+    Iterable,
+    Mapping,
+    Sequence,
+)
 
 import httpx
 
-from aether.exceptions import AetherError
-from aether.events import subscribe_events_async
-from aether.namespaces import (
-    AsyncAgentsNamespace,
-    AsyncCronNamespace,
-    AsyncFSNamespace,
-    AsyncIntegrationsNamespace,
-    AsyncMarketplaceNamespace,
-    AsyncOrgsNamespace,
-    AsyncPluginsNamespace,
-    AsyncSystemNamespace,
-    AsyncTemplatesNamespace,
-    AsyncTriggersNamespace,
-    AsyncWebhooksNamespace,
+from aether._cache import _MISSING, _NO_CACHE, _ETagCache, _TTLCache, cache_key
+from aether._json import JSON_HEADERS, dumps
+from aether._response import handle_response, handle_response_as
+from aether.client import (
+    _SOCKET_OPTIONS,
+    _pool_limits,
+    _proxy_mounts,
+    _resolve_http2,
+    _ssl_context,
+    mypyc_attr,
+)
+from aether.events import (
+    _EVENTS_PATH,
+    _batch_events,
+    _stream_event_chunks_async,
+    _stream_events_async,
 )
 
+if TYPE_CHECKING:
+    from aether.namespaces import (
+        AsyncAgentsNamespace,
+        AsyncCronNamespace,
+        AsyncFSNamespace,
+        AsyncIntegrationsNamespace,
+        AsyncMarketplaceNamespace,
+        AsyncOrgsNamespace,
+        AsyncPluginsNamespace,
+        AsyncSystemNamespace,
+        AsyncTemplatesNamespace,
+        AsyncTriggersNamespace,
+        AsyncWebhooksNamespace,
+    )
+
+# Namespace attributes are built on first access; see ``__getattr__``.
+_NAMESPACE_MAP: dict[str, str] = {
+    "agents": "AsyncAgentsNamespace",
+    "fs": "AsyncFSNamespace",
+    "templates": "AsyncTemplatesNamespace",
+    "system": "AsyncSystemNamespace",
+    "cron": "AsyncCronNamespace",
+    "triggers": "AsyncTriggersNamespace",
+    "orgs": "AsyncOrgsNamespace",
+    "marketplace": "AsyncMarketplaceNamespace",
+    "integrations": "AsyncIntegrationsNamespace",
+    "webhooks": "AsyncWebhooksNamespace",
+    "plugins": "AsyncPluginsNamespace",
+}
+
 
 class _AsyncEventsAccessor:
     """Thin accessor so ``client.events.subscribe(...)`` mirrors the TS SDK."""
 
-    def __init__(self, base_url: str, get_token: Any) -> None:
+    __slots__ = ("_base_url", "_url", "_client")
+
+    def __init__(self, base_url: str, client: httpx.AsyncClient) -> None:
         self._base_url = base_url
-        self._get_token = get_token
+        # The owning client has already stripped trailing slashes.
+        self._url = base_url + _EVENTS_PATH
+        self._client = client
 
     def subscribe(
-        self, filter: list[str] | None = None
+        self, filter: Sequence[str] | None = None
     ) -> AsyncIterator[dict[str, Any]]:
         """Open an SSE connection and yield parsed events asynchronously.
 
         Args:
-            filter: Optional list of event types to subscribe to.
+            filter: Optional event types to subscribe to. Passing a tuple
+                lets repeated subscriptions reuse the joined filter string.
 
         Returns:
             An async iterator of event dictionaries.
         """
-        return subscribe_events_async(
-            self._base_url,
-            token=self._get_token(),
-            filter=filter,
+        return _stream_events_async(
+            self._url,
+            # The shared client already sends the current Authorization header.
+            None,
+            filter,
+            timeout=0,
+            client=self._client,
+        )
+
+    def subscribe_batched(
+        self,
+        filter: Sequence[str] | None = None,
+        *,
+        batch_size: int = 64,
+        max_wait_ms: float = 10,
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """Open an SSE connection and yield events in batches.
+
+        See :func:`aether.events.subscribe_events_batched_async` for the
+        batching rules.
+
+        Args:
+            filter: Optional event types to subscribe to.
+            batch_size: Maximum number of events per batch.
+            max_wait_ms: Maximum age in milliseconds of the oldest pending
+                event before the batch is flushed.
+
+        Returns:
+            An async iterator of event lists.
+        """
+        chunks = _stream_event_chunks_async(
+            self._url, None, filter, timeout=0, client=self._client
         )
+        return _batch_events(chunks, batch_size, max_wait_ms)
+
 
+def _make_transports(
+    name: str, *, http2: bool | None, limits: httpx.Limits
+) -> tuple[httpx.AsyncBaseTransport, Mapping[str, httpx.AsyncBaseTransport | None]]:
+    """Build the httpx transport for the requested backend and its proxy mounts.
 
+    aiohttp applies the environment's proxy settings itself, so it needs no
+    mounts.
+    """
+    if name == "httpx":
+        http2 = _resolve_http2(http2)
+
+        def make_transport(
+            proxy: httpx.Proxy | None = None,
+        ) -> httpx.AsyncHTTPTransport:
+            return httpx.AsyncHTTPTransport(
+                verify=_ssl_context(http2),
+                http2=http2,
+                limits=limits,
+                proxy=proxy,
+                retries=1,
+                socket_options=_SOCKET_OPTIONS,
+            )
+
+        return make_transport(), _proxy_mounts(make_transport)
+    if name == "aiohttp":
+        if http2:
+            raise ValueError("The aiohttp transport does not support http2")
+        from aether._aiohttp import _AiohttpTransport
+
+        return _AiohttpTransport(limits=limits), {}
+    raise ValueError(f"Unknown transport {name!r}; expected 'httpx' or 'aiohttp'")
+
+
+def _check_concurrency(max_concurrency: int) -> None:
+    """Reject limits that would make :meth:`AetherAsyncClient.gather` hang."""
+    if max_concurrency < 1:
+        raise ValueError(f"max_concurrency must be at least 1, got {max_concurrency}")
+
+
+def _forget(
+    inflight: dict[Hashable, asyncio.Task[Any]], key: Hashable, task: asyncio.Task[Any]
+) -> None:
+    """Drop a finished coalesced GET so later calls send a new request."""
+    if inflight.get(key) is task:
+        del inflight[key]
+    if not task.cancelled():
+        # Mark the exception retrieved even if every waiter was cancelled.
+        task.exception()
+
+
+# A regular Python class under mypyc too; see ``AetherClient``.
+@mypyc_attr(native_class=False)
 class AetherAsyncClient:
     """Asynchronous client for the Aether OS REST API.
 
@@ -73,35 +202,112 @@ class AetherAsyncClient:
         token: Optional bearer token. Can also be set later via
             :meth:`login` or :meth:`set_token`.
         timeout: HTTP request timeout in seconds. Defaults to 30.
+        connect_timeout: Seconds allowed for establishing a connection.
+            Defaults to 5, so an unreachable server fails fast while slow
+            responses still get the full ``timeout``.
+        http2: Negotiate HTTP/2 so concurrent requests are multiplexed over
+            a single connection. Requires the ``http2`` extra
+            (``pip install "aether-os-sdk[http2]"``). Defaults to ``None``,
+            which enables it whenever that extra is installed and the
+            ``httpx`` transport is used; servers without HTTP/2 support
+            fall back to HTTP/1.1 during the TLS handshake.
+        limits: Connection pool limits. Defaults to 64 connections with
+            up to 16 kept alive.
+        keepalive_expiry: Seconds an idle pooled connection is kept open.
+            Only used when ``limits`` is not given. Defaults to 30.
+        max_concurrency: Upper bound on requests :meth:`gather` keeps in
+            flight at once. Defaults to 16.
+        transport: HTTP backend, ``"httpx"`` (default) or ``"aiohttp"``.
+            The aiohttp backend trades httpcore's pure-Python protocol
+            layer for aiohttp's compiled one and requires the ``aiohttp``
+            extra. It does not support ``http2``.
+        etag_cache_size: Number of GET responses to keep for conditional
+            requests. When the server sends an ``ETag``, repeated GETs send
+            ``If-None-Match`` and a ``304`` reply returns the cached data
+            without re-downloading it. Cached objects are shared between
+            calls and should not be mutated. ``0`` (the default) disables
+            the cache.
+        cache_ttl: Seconds a response fetched by a namespace method called
+            with ``cache=True`` is reused for. Defaults to 5.
+        coalesce_gets: Share one request between concurrent identical
+            GETs: a call made while the same path and query are already
+            in flight awaits that request instead of sending another. The
+            result object is shared and should not be mutated. Defaults to
+            ``False``.
+
+    Raises:
+        ValueError: If ``transport`` is unknown or combined with an
+            unsupported option, or if ``max_concurrency`` is below 1.
     """
 
+    # Quoted so mypyc records them as strings: the namespace classes are
+    # only imported for type checking.
+    agents: "AsyncAgentsNamespace"
+    fs: "AsyncFSNamespace"
+    templates: "AsyncTemplatesNamespace"
+    system: "AsyncSystemNamespace"
+    events: "_AsyncEventsAccessor"
+    cron: "AsyncCronNamespace"
+    triggers: "AsyncTriggersNamespace"
+    orgs: "AsyncOrgsNamespace"
+    marketplace: "AsyncMarketplaceNamespace"
+    integrations: "AsyncIntegrationsNamespace"
+    webhooks: "AsyncWebhooksNamespace"
+    plugins: "AsyncPluginsNamespace"
+
     def __init__(
         self,
         base_url: str,
         token: str | None = None,
         *,
         timeout: float = 30.0,
+        connect_timeout: float = 5.0,
+        http2: bool | None = None,
+        limits: httpx.Limits | None = None,
+        keepalive_expiry: float = 30.0,
+        max_concurrency: int = 16,
+        transport: str = "httpx",
+        etag_cache_size: int = 0,
+        cache_ttl: float = 5.0,
+        coalesce_gets: bool = False,
     ) -> None:
+        _check_concurrency(max_concurrency)
         self._base_url = base_url.rstrip("/")
         self._token: str | None = token
+        self._etag_cache = _ETagCache(etag_cache_size) if etag_cache_size > 0 else None
+        self._response_cache = _TTLCache(256, cache_ttl)
+        self._concurrency_limit = max_concurrency
+        self._inflight: dict[Hashable, asyncio.Task[Any]] | None = (
+            {} if coalesce_gets else None
+        )
+        http_transport, mounts = _make_transports(
+            transport,
+            http2=http2,
+            limits=_pool_limits(limits, keepalive_expiry),
+        )
         self._http = httpx.AsyncClient(
             base_url=self._base_url,
-            timeout=timeout,
+            timeout=httpx.Timeout(timeout, connect=connect_timeout),
+            transport=http_transport,
+            mounts=mounts,
         )
-
-        # Namespace accessors
-        self.agents = AsyncAgentsNamespace(self)
-        self.fs = AsyncFSNamespace(self)
-        self.templates = AsyncTemplatesNamespace(self)
-        self.system = AsyncSystemNamespace(self)
-        self.events = _AsyncEventsAccessor(self._base_url, lambda: self._token)
-        self.cron = AsyncCronNamespace(self)
-        self.triggers = AsyncTriggersNamespace(self)
-        self.orgs = AsyncOrgsNamespace(self)
-        self.marketplace = AsyncMarketplaceNamespace(self)
-        self.integrations = AsyncIntegrationsNamespace(self)
-        self.webhooks = AsyncWebhooksNamespace(self)
-        self.plugins = AsyncPluginsNamespace(self)
+        self._apply_token()
+
+    def __getattr__(self, name: str) -> Any:
+        # Only reached while a namespace attribute is still unset: build
+        # the namespace, store it on the client and return it.
+        cls_name = _NAMESPACE_MAP.get(name)
+        if cls_name is None:
+            if name == "events":
+                self.events = _AsyncEventsAccessor(self._base_url, self._http)
+                return self.events
+            raise AttributeError(
+                f"{type(self).__name__!r} object has no attribute {name!r}"
+            )
+        namespaces = importlib.import_module("aether.namespaces")
+        namespace = getattr(namespaces, cls_name)(self)
+        setattr(self, name, namespace)
+        return namespace
 
     # -- Context manager ----------------------------------------------------
 
@@ -115,6 +321,119 @@ class AetherAsyncClient:
         """Close the underlying async HTTP connection pool."""
         await self._http.aclose()
 
+    # -- Concurrency --------------------------------------------------------
+
+    async def gather(
+        self,
+        *aws: Awaitable[Any],
+        return_exceptions: bool = False,
+        max_concurrency: int | None = None,
+    ) -> list[Any]:
+        """Await several API calls concurrently.
+
+        Results are returned in argument order, as with
+        :func:`asyncio.gather`. At most ``max_concurrency`` calls run at
+        once so large fan-outs do not exhaust the connection pool::
+
+            agents, status = await client.gather(
+                client.agents.list(),
+                client.system.status(),
+            )
+
+        Args:
+            *aws: Awaitables returned by namespace methods.
+            return_exceptions: Return raised exceptions in the result list
+                instead of propagating the first one.
+            max_concurrency: Override the client's ``max_concurrency`` for
+                this call, e.g. to go easy on a slow endpoint.
+
+        Returns:
+            A list with one result per awaitable.
+
+        Raises:
+            ValueError: If ``max_concurrency`` is below 1.
+        """
+        if max_concurrency is None:
+            max_concurrency = self._concurrency_limit
+        else:
+            try:
+                _check_concurrency(max_concurrency)
+            except ValueError:
+                # Nothing will await them; close coroutines to avoid warnings.
+                for aw in aws:
+                    if asyncio.iscoroutine(aw):
+                        aw.close()
+                raise
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _bounded(aw: Awaitable[Any]) -> Any:
+            async with semaphore:
+                return await aw
+
+        return await asyncio.gather(
+            *(_bounded(aw) for aw in aws), return_exceptions=return_exceptions
+        )
+
+    async def batch(
+        self,
+        requests: Iterable[tuple[str, str, Any]],
+        *,
+        return_exceptions: bool = False,
+    ) -> list[Any]:
+        """Send a batch of raw API requests concurrently.
+
+        Each request is a ``(method, path, json_body)`` tuple, with
+        ``json_body`` ``None`` for requests without one. All requests are
+        built up front and dispatched together through :meth:`gather`, and
+        results come back in request order, so bulk scripts pay roughly one
+        round trip per ``max_concurrency`` requests instead of one each.
+        With HTTP/2 enabled they also share a single connection::
+
+            results = await client.batch(
+                ("POST", "/api/v1/webhooks", {"url": url, "events": ["agent.*"]})
+                for url in urls
+            )
+
+        Args:
+            requests: ``(method, path, json_body)`` tuples.
+            return_exceptions: Return raised exceptions in the result list
+                instead of propagating the first one.
+
+        Returns:
+            A list with one unwrapped result per request.
+        """
+        prepared = [
+            self.prepare(method, path, json=body) for method, path, body in requests
+        ]
+        return await self.gather(
+            *(self.send(request) for request in prepared),
+            return_exceptions=return_exceptions,
+        )
+
+    async def prefetch_catalog(self) -> dict[str, Any]:
+        """Fetch the catalogue listings concurrently.
+
+        Issues ``templates.list()``, ``marketplace.templates.list()``,
+        ``plugins.list()`` and ``integrations.list()`` at once, so startup
+        waits for the slowest call instead of the sum of all four.
+
+        Returns:
+            A dict with ``templates``, ``marketplace_templates``,
+            ``plugins`` and ``integrations`` keys.
+        """
+        templates, marketplace_templates, plugins, integrations = await self.gather(
+            self.templates.list(),
+            self.marketplace.templates.list(),
+            self.plugins.list(),
+            self.integrations.list(),
+        )
+        return {
+            "templates": templates,
+            "marketplace_templates": marketplace_templates,
+            "plugins": plugins,
+            "integrations": integrations,
+        }
+
     # -- Authentication -----------------------------------------------------
 
     async def login(self, username: str, password: str) -> dict[str, Any]:
@@ -136,78 +455,179 @@ class AetherAsyncClient:
         )
         if isinstance(result, dict) and "token" in result:
             self._token = result["token"]
+            self._apply_token()
         return result
 
-    def set_token(self, token: str) -> None:
+    def set_token(self, token: str | None) -> None:
         """Manually set the bearer token for subsequent requests.
 
+        The token is stored in the shared HTTP client's default headers, so
+        it is not rebuilt per request.
+
         Args:
-            token: The bearer token string.
+            token: The bearer token string, or ``None`` to stop sending an
+                ``Authorization`` header.
         """
         self._token = token
+        self._apply_token()
 
-    # -- Internal HTTP helpers ----------------------------------------------
+    # -- Prepared requests --------------------------------------------------
 
-    def _headers(self) -> dict[str, str]:
-        """Build common request headers."""
-        headers: dict[str, str] = {}
-        if self._token:
-            headers["Authorization"] = f"Bearer {self._token}"
-        return headers
+    def prepare(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: dict[str, Any] | None = None,
+        json: Any | None = None,
+    ) -> httpx.Request:
+        """Build a reusable request for an endpoint that is called repeatedly.
 
-    def _handle_response(self, response: httpx.Response) -> Any:
-        """Process an HTTP response, raising on errors.
+        URL merging, query encoding, header merging and body encoding
+        happen once here. The returned request can be passed to
+        :meth:`send` any number of times, which suits tight polling loops::
 
-        On success, returns ``response.json()["data"]`` if the body contains
-        a ``data`` key, otherwise returns the full parsed JSON.
+            status_request = client.prepare("GET", "/api/v1/system/status")
+            while True:
+                status = await client.send(status_request)
+
+        The current bearer token is captured when the request is built;
+        prepare it again after :meth:`set_token` or :meth:`login`.
+
+        Args:
+            method: HTTP method, e.g. ``"GET"``.
+            path: API path relative to the base URL.
+            params: Optional query parameters.
+            json: Optional JSON request body.
+
+        Returns:
+            A prepared :class:`httpx.Request`.
         """
-        if not response.is_success:
-            parsed: dict[str, Any] | None = None
-            try:
-                parsed = response.json()
-            except Exception:
-                parsed = None
-
-            message = (
-                parsed.get("error", {}).get("message")
-                if isinstance(parsed, dict)
-                else None
-            ) or f"HTTP {response.status_code}: {response.reason_phrase}"
-
-            code = (
-                parsed.get("error", {}).get("code")
-                if isinstance(parsed, dict)
-                else None
-            ) or f"HTTP_{response.status_code}"
-
-            raise AetherError(message, code=code, status=response.status_code)
-
-        data = response.json()
-        if isinstance(data, dict) and "data" in data:
-            return data["data"]
+        if json is None:
+            return self._http.build_request(method, path, params=params)
+        return self._http.build_request(
+            method, path, params=params, content=dumps(json), headers=JSON_HEADERS
+        )
+
+    async def send(self, request: httpx.Request) -> Any:
+        """Send a request built by :meth:`prepare`.
+
+        Returns:
+            The unwrapped response data, as for namespace methods.
+
+        Raises:
+            AetherError: If the server returns a non-2xx status.
+        """
+        return handle_response(await self._http.send(request))
+
+    # -- Internal HTTP helpers ----------------------------------------------
+
+    def _apply_token(self) -> None:
+        """Sync the bearer token into the HTTP client's default headers."""
+        if self._token:
+            self._http.headers["Authorization"] = f"Bearer {self._token}"
+        else:
+            self._http.headers.pop("Authorization", None)
+        # Responses may differ per identity; never serve them across tokens.
+        self._response_cache.clear()
+        if self._etag_cache is not None:
+            self._etag_cache.clear()
+        if self._inflight:
+            self._inflight.clear()
+
+    async def _get(
+        self,
+        path: str,
+        *,
+        params: dict[str, Any] | None = None,
+        cache: bool = False,
+        no_cache: bool = False,
+    ) -> Any:
+        """Send an async GET request.
+
+        With ``cache=True`` a response younger than ``cache_ttl`` is
+        returned without a request. ``no_cache=True`` bypasses both that
+        cache and the ETag cache and asks intermediaries for a fresh copy.
+        """
+        if no_cache:
+            response = await self._http.get(path, params=params, headers=_NO_CACHE)
+            return handle_response(response)
+
+        if cache:
+            key = cache_key(path, params)
+            data = self._response_cache.get(key)
+            if data is _MISSING:
+                data = await self._get(path, params=params)
+                self._response_cache.set(key, data)
+            return data
+
+        inflight = self._inflight
+        if inflight is None:
+            return await self._fetch(path, params)
+
+        key = cache_key(path, params)
+        task = inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch(path, params))
+            inflight[key] = task
+            task.add_done_callback(lambda done: _forget(inflight, key, done))
+        # Shielded so one caller's cancellation does not fail the others.
+        return await asyncio.shield(task)
+
+    async def _fetch(self, path: str, params: dict[str, Any] | None) -> Any:
+        """Send a GET, revalidating through the ETag cache when enabled."""
+        etags = self._etag_cache
+        if etags is None:
+            response = await self._http.get(path, params=params)
+            return handle_response(response)
+
+        key = cache_key(path, params)
+        headers, entry = etags.lookup(key)
+        response = await self._http.get(path, params=params, headers=headers)
+        if entry is not None and response.status_code == 304:
+            return entry[1]
+        data = handle_response(response)
+        etags.store(key, response, data)
         return data
 
-    async def _get(self, path: str, *, params: dict[str, Any] | None = None) -> Any:
-        """Send an async GET request."""
-        response = await self._http.get(path, params=params, headers=self._headers())
-        return self._handle_response(response)
+    async def _get_as(self, path: str, type: Any) -> Any:
+        """Send an async GET and decode its ``data`` member into ``type``.
+
+        Decoding goes straight from the response bytes to msgspec structs;
+        see :mod:`aether.models`.
+        """
+        return handle_response_as(await self._http.get(path), type)
 
     async def _post(self, path: str, *, json: Any | None = None) -> Any:
         """Send an async POST request."""
-        response = await self._http.post(path, json=json, headers=self._headers())
-        return self._handle_response(response)
+        if json is None:
+            response = await self._http.post(path)
+        else:
+            response = await self._http.post(
+                path, content=dumps(json), headers=JSON_HEADERS
+            )
+        return handle_response(response)
+
+    async def _post_raw(self, path: str, *, content: bytes) -> Any:
+        """Send an async POST request with an already-encoded JSON body."""
+        response = await self._http.post(path, content=content, headers=JSON_HEADERS)
+        return handle_response(response)
 
     async def _put(self, path: str, *, json: Any) -> Any:
         """Send an async PUT request."""
-        response = await self._http.put(path, json=json, headers=self._headers())
-        return self._handle_response(response)
+        response = await self._http.put(
+            path, content=dumps(json), headers=JSON_HEADERS
+        )
+        return handle_response(response)
 
     async def _patch(self, path: str, *, json: Any) -> Any:
         """Send an async PATCH request."""
-        response = await self._http.patch(path, json=json, headers=self._headers())
-        return self._handle_response(response)
+        response = await self._http.patch(
+            path, content=dumps(json), headers=JSON_HEADERS
+        )
+        return handle_response(response)
 
     async def _delete(self, path: str) -> Any:
         """Send an async DELETE request."""
-        response = await self._http.delete(path, headers=self._headers())
-        return self._handle_response(response)
+        response = await self._http.delete(path)
+        return handle_response(response)
@@ -6,50 +6,197 @@ Aether OS REST API v1 using :mod:`httpx`.
 
 from __future__ import annotations
 
-from typing import Any
+import importlib
+import importlib.util
+import ipaddress
+import socket
+import ssl
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Callable, Mapping, Sequence, TypeVar
 
 import httpx
 
-from aether.exceptions import AetherError
-from aether.events import subscribe_events
-from aether.namespaces import (
-    AgentsNamespace,
-    CronNamespace,
-    FSNamespace,
-    IntegrationsNamespace,
-    MarketplaceNamespace,
-    OrgsNamespace,
-    PluginsNamespace,
-    SystemNamespace,
-    TemplatesNamespace,
-    TriggersNamespace,
-    WebhooksNamespace,
-)
+from aether._cache import _MISSING, _NO_CACHE, _ETagCache, _TTLCache, cache_key
+from aether._json import JSON_HEADERS, dumps
+from aether._response import handle_response, handle_response_as
+from aether.events import _EVENTS_PATH, _stream_events
+
+try:
+    from httpx import create_ssl_context
+except ImportError:  # httpx < 0.28
+    from httpx._config import create_ssl_context
+
+try:
+    from mypy_extensions import mypyc_attr
+except ImportError:  # only mypyc builds need the real decorator
+
+    def mypyc_attr(*args: str, **kw: object) -> Any:  # type: ignore[misc, no-redef]
+        return lambda cls: cls
+
+if TYPE_CHECKING:
+    from aether.namespaces import (
+        AgentsNamespace,
+        CronNamespace,
+        FSNamespace,
+        IntegrationsNamespace,
+        MarketplaceNamespace,
+        OrgsNamespace,
+        PluginsNamespace,
+        SystemNamespace,
+        TemplatesNamespace,
+        TriggersNamespace,
+        WebhooksNamespace,
+    )
+
+# Namespace attributes are built on first access; see ``__getattr__``.
+_NAMESPACE_MAP: dict[str, str] = {
+    "agents": "AgentsNamespace",
+    "fs": "FSNamespace",
+    "templates": "TemplatesNamespace",
+    "system": "SystemNamespace",
+    "cron": "CronNamespace",
+    "triggers": "TriggersNamespace",
+    "orgs": "OrgsNamespace",
+    "marketplace": "MarketplaceNamespace",
+    "integrations": "IntegrationsNamespace",
+    "webhooks": "WebhooksNamespace",
+    "plugins": "PluginsNamespace",
+}
+
+# Disable Nagle's algorithm: SDK traffic is many small request bodies where
+# coalescing delays only add latency.
+_SOCKET_OPTIONS = [(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)]
+
+
+def _pool_limits(limits: httpx.Limits | None, keepalive_expiry: float) -> httpx.Limits:
+    """Return ``limits`` or the SDK's default pool sizing."""
+    if limits is not None:
+        return limits
+    return httpx.Limits(
+        max_connections=64,
+        max_keepalive_connections=16,
+        keepalive_expiry=keepalive_expiry,
+    )
+
+
+def _resolve_http2(http2: bool | None) -> bool:
+    """Return ``http2``, or whether the ``h2`` package is installed if unset."""
+    if http2 is None:
+        return importlib.util.find_spec("h2") is not None
+    return http2
+
+
+_T = TypeVar("_T")
+
+
+def _no_proxy_pattern(host: str) -> str:
+    """Return the httpx mount pattern for one ``NO_PROXY`` entry."""
+    if "://" in host:
+        return host
+    try:
+        address = ipaddress.ip_address(host)
+    except ValueError:
+        # A bare name also covers its subdomains, as httpx does.
+        return f"all://*{host}"
+    return f"all://[{host}]" if address.version == 6 else f"all://{host}"
+
+
+def _proxy_mounts(
+    make_transport: Callable[[httpx.Proxy], _T],
+) -> Mapping[str, _T | None]:
+    """Return httpx mounts for the proxies configured in the environment.
+
+    httpx only reads ``HTTP_PROXY``/``HTTPS_PROXY``/``ALL_PROXY`` and
+    ``NO_PROXY`` when the client builds its own transport. The SDK passes a
+    tuned one, so the proxy routes are rebuilt here from
+    :func:`urllib.request.getproxies` with the same settings; ``None``
+    entries (``NO_PROXY`` matches) fall through to the direct transport.
+    """
+    proxies = urllib.request.getproxies()
+    bypass = [host.strip() for host in proxies.get("no", "").split(",")]
+    if "*" in bypass:
+        return {}
+
+    mounts: dict[str, _T | None] = {}
+    for scheme in ("http", "https", "all"):
+        url = proxies.get(scheme)
+        if url:
+            if "://" not in url:
+                url = f"http://{url}"
+            mounts[f"{scheme}://"] = make_transport(httpx.Proxy(url))
+    for host in bypass:
+        if host:
+            mounts[_no_proxy_pattern(host)] = None
+    return mounts
+
+
+def _make_transports(
+    *, http2: bool, limits: httpx.Limits
+) -> tuple[httpx.HTTPTransport, Mapping[str, httpx.HTTPTransport | None]]:
+    """Build the tuned sync transport and its environment proxy mounts."""
+
+    def make_transport(proxy: httpx.Proxy | None = None) -> httpx.HTTPTransport:
+        return httpx.HTTPTransport(
+            verify=_ssl_context(http2),
+            http2=http2,
+            limits=limits,
+            proxy=proxy,
+            retries=1,
+            socket_options=_SOCKET_OPTIONS,
+        )
+
+    return make_transport(), _proxy_mounts(make_transport)
+
+
+@lru_cache(maxsize=None)
+def _ssl_context(http2: bool) -> ssl.SSLContext:
+    """Return the default verifying SSL context, built once per process.
+
+    Loading the CA bundle dominates client construction (tens of
+    milliseconds), so every client shares one context. httpcore sets the
+    ALPN protocols on each connection, hence one context per ``http2``
+    setting so clients never see each other's protocol list.
+    """
+    return create_ssl_context()
 
 
 class _EventsAccessor:
     """Thin accessor so ``client.events.subscribe(...)`` mirrors the TS SDK."""
 
-    def __init__(self, base_url: str, get_token: Any) -> None:
+    __slots__ = ("_base_url", "_url", "_client")
+
+    def __init__(self, base_url: str, client: httpx.Client) -> None:
         self._base_url = base_url
-        self._get_token = get_token
+        # The owning client has already stripped trailing slashes.
+        self._url = base_url + _EVENTS_PATH
+        self._client = client
 
-    def subscribe(self, filter: list[str] | None = None):
+    def subscribe(self, filter: Sequence[str] | None = None):
         """Open an SSE connection and yield parsed events.
 
         Args:
-            filter: Optional list of event types to subscribe to.
+            filter: Optional event types to subscribe to. Passing a tuple
+                lets repeated subscriptions reuse the joined filter string.
 
         Returns:
             A synchronous iterator of event dictionaries.
         """
-        return subscribe_events(
-            self._base_url,
-            token=self._get_token(),
-            filter=filter,
+        return _stream_events(
+            self._url,
+            # The shared client already sends the current Authorization header.
+            None,
+            filter,
+            timeout=0,
+            client=self._client,
         )
 
 
+# Compiled builds keep the client a regular Python class: native classes
+# have no __dict__ or __weakref__, which breaks mock.patch.object(),
+# weakref.ref() and ad-hoc attributes on the one client a process holds.
+@mypyc_attr(native_class=False)
 class AetherClient:
     """Synchronous client for the Aether OS REST API.
 
@@ -74,35 +221,88 @@ class AetherClient:
         token: Optional bearer token. Can also be set later via
             :meth:`login` or :meth:`set_token`.
         timeout: HTTP request timeout in seconds. Defaults to 30.
+        connect_timeout: Seconds allowed for establishing a connection.
+            Defaults to 5, so an unreachable server fails fast while slow
+            responses still get the full ``timeout``.
+        http2: Negotiate HTTP/2 so concurrent requests are multiplexed over
+            a single connection. Requires the ``http2`` extra
+            (``pip install "aether-os-sdk[http2]"``). Defaults to ``None``,
+            which enables it whenever that extra is installed; servers
+            without HTTP/2 support fall back to HTTP/1.1 during the TLS
+            handshake.
+        limits: Connection pool limits. Defaults to 64 connections with
+            up to 16 kept alive.
+        keepalive_expiry: Seconds an idle pooled connection is kept open.
+            Only used when ``limits`` is not given. Defaults to 30.
+        etag_cache_size: Number of GET responses to keep for conditional
+            requests. When the server sends an ``ETag``, repeated GETs send
+            ``If-None-Match`` and a ``304`` reply returns the cached data
+            without re-downloading it. Cached objects are shared between
+            calls and should not be mutated. ``0`` (the default) disables
+            the cache.
+        cache_ttl: Seconds a response fetched by a namespace method called
+            with ``cache=True`` is reused for. Defaults to 5.
     """
 
+    # Quoted so mypyc records them as strings: the namespace classes are
+    # only imported for type checking.
+    agents: "AgentsNamespace"
+    fs: "FSNamespace"
+    templates: "TemplatesNamespace"
+    system: "SystemNamespace"
+    events: "_EventsAccessor"
+    cron: "CronNamespace"
+    triggers: "TriggersNamespace"
+    orgs: "OrgsNamespace"
+    marketplace: "MarketplaceNamespace"
+    integrations: "IntegrationsNamespace"
+    webhooks: "WebhooksNamespace"
+    plugins: "PluginsNamespace"
+
     def __init__(
         self,
         base_url: str,
         token: str | None = None,
         *,
         timeout: float = 30.0,
+        connect_timeout: float = 5.0,
+        http2: bool | None = None,
+        limits: httpx.Limits | None = None,
+        keepalive_expiry: float = 30.0,
+        etag_cache_size: int = 0,
+        cache_ttl: float = 5.0,
     ) -> None:
+        http2 = _resolve_http2(http2)
         self._base_url = base_url.rstrip("/")
         self._token: str | None = token
+        self._etag_cache = _ETagCache(etag_cache_size) if etag_cache_size > 0 else None
+        self._response_cache = _TTLCache(256, cache_ttl)
+        transport, mounts = _make_transports(
+            http2=http2, limits=_pool_limits(limits, keepalive_expiry)
+        )
         self._http = httpx.Client(
             base_url=self._base_url,
-            timeout=timeout,
+            timeout=httpx.Timeout(timeout, connect=connect_timeout),
+            transport=transport,
+            mounts=mounts,
         )
-
-        # Namespace accessors
-        self.agents = AgentsNamespace(self)
-        self.fs = FSNamespace(self)
-        self.templates = TemplatesNamespace(self)
-        self.system = SystemNamespace(self)
-        self.events = _EventsAccessor(self._base_url, lambda: self._token)
-        self.cron = CronNamespace(self)
-        self.triggers = TriggersNamespace(self)
-        self.orgs = OrgsNamespace(self)
-        self.marketplace = MarketplaceNamespace(self)
-        self.integrations = IntegrationsNamespace(self)
-        self.webhooks = WebhooksNamespace(self)
-        self.plugins = PluginsNamespace(self)
+        self._apply_token()
+
+    def __getattr__(self, name: str) -> Any:
+        # Only reached while a namespace attribute is still unset: build
+        # the namespace, store it on the client and return it.
+        cls_name = _NAMESPACE_MAP.get(name)
+        if cls_name is None:
+            if name == "events":
+                self.events = _EventsAccessor(self._base_url, self._http)
+                return self.events
+            raise AttributeError(
+                f"{type(self).__name__!r} object has no attribute {name!r}"
+            )
+        namespaces = importlib.import_module("aether.namespaces")
+        namespace = getattr(namespaces, cls_name)(self)
+        setattr(self, name, namespace)
+        return namespace
 
     # -- Context manager ----------------------------------------------------
 
@@ -116,6 +316,35 @@ class AetherClient:
         """Close the underlying HTTP connection pool."""
         self._http.close()
 
+    # -- Concurrency --------------------------------------------------------
+
+    def prefetch_catalog(self) -> dict[str, Any]:
+        """Fetch the catalogue listings concurrently.
+
+        Issues ``templates.list()``, ``marketplace.templates.list()``,
+        ``plugins.list()`` and ``integrations.list()`` from a small thread
+        pool, so startup waits for the slowest call instead of the sum of
+        all four.
+
+        Returns:
+            A dict with ``templates``, ``marketplace_templates``,
+            ``plugins`` and ``integrations`` keys.
+        """
+        # Bound methods are resolved here so lazy namespaces are built on
+        # the calling thread, not concurrently inside the pool.
+        templates = self.templates
+        marketplace_templates = self.marketplace.templates
+        plugins = self.plugins
+        integrations = self.integrations
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            futures = {
+                "templates": pool.submit(templates.list),
+                "marketplace_templates": pool.submit(marketplace_templates.list),
+                "plugins": pool.submit(plugins.list),
+                "integrations": pool.submit(integrations.list),
+            }
+            return {key: future.result() for key, future in futures.items()}
+
     # -- Authentication -----------------------------------------------------
 
     def login(self, username: str, password: str) -> dict[str, Any]:
@@ -137,79 +366,162 @@ class AetherClient:
         )
         if isinstance(result, dict) and "token" in result:
             self._token = result["token"]
+            self._apply_token()
         return result
 
-    def set_token(self, token: str) -> None:
+    def set_token(self, token: str | None) -> None:
         """Manually set the bearer token for subsequent requests.
 
+        The token is stored in the shared HTTP client's default headers, so
+        it is not rebuilt per request.
+
         Args:
-            token: The bearer token string.
+            token: The bearer token string, or ``None`` to stop sending an
+                ``Authorization`` header.
         """
         self._token = token
+        self._apply_token()
 
-    # -- Internal HTTP helpers ----------------------------------------------
+    # -- Prepared requests --------------------------------------------------
 
-    def _headers(self) -> dict[str, str]:
-        """Build common request headers."""
-        headers: dict[str, str] = {}
-        if self._token:
-            headers["Authorization"] = f"Bearer {self._token}"
-        return headers
+    def prepare(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: dict[str, Any] | None = None,
+        json: Any | None = None,
+    ) -> httpx.Request:
+        """Build a reusable request for an endpoint that is called repeatedly.
+
+        URL merging, query encoding, header merging and body encoding
+        happen once here. The returned request can be passed to
+        :meth:`send` any number of times, which suits tight polling loops::
 
-    def _handle_response(self, response: httpx.Response) -> Any:
-        """Process an HTTP response, raising on errors.
+            status_request = client.prepare("GET", "/api/v1/system/status")
+            while True:
+                status = client.send(status_request)
 
-        On success, returns ``response.json()["data"]`` if the body contains
-        a ``data`` key, otherwise returns the full parsed JSON.
+        The current bearer token is captured when the request is built;
+        prepare it again after :meth:`set_token` or :meth:`login`.
+
+        Args:
+            method: HTTP method, e.g. ``"GET"``.
+            path: API path relative to the base URL.
+            params: Optional query parameters.
+            json: Optional JSON request body.
+
+        Returns:
+            A prepared :class:`httpx.Request`.
+        """
+        if json is None:
+            return self._http.build_request(method, path, params=params)
+        return self._http.build_request(
+            method, path, params=params, content=dumps(json), headers=JSON_HEADERS
+        )
+
+    def send(self, request: httpx.Request) -> Any:
+        """Send a request built by :meth:`prepare`.
+
+        Returns:
+            The unwrapped response data, as for namespace methods.
+
+        Raises:
+            AetherError: If the server returns a non-2xx status.
         """
-        if not response.is_success:
-            body_text = response.text
-            parsed: dict[str, Any] | None = None
-            try:
-                parsed = response.json()
-            except Exception:
-                parsed = None
-
-            message = (
-                parsed.get("error", {}).get("message")
-                if isinstance(parsed, dict)
-                else None
-            ) or f"HTTP {response.status_code}: {response.reason_phrase}"
-
-            code = (
-                parsed.get("error", {}).get("code")
-                if isinstance(parsed, dict)
-                else None
-            ) or f"HTTP_{response.status_code}"
-
-            raise AetherError(message, code=code, status=response.status_code)
-
-        data = response.json()
-        if isinstance(data, dict) and "data" in data:
-            return data["data"]
+        return handle_response(self._http.send(request))
+
+    # -- Internal HTTP helpers ----------------------------------------------
+
+    def _apply_token(self) -> None:
+        """Sync the bearer token into the HTTP client's default headers."""
+        if self._token:
+            self._http.headers["Authorization"] = f"Bearer {self._token}"
+        else:
+            self._http.headers.pop("Authorization", None)
+        # Responses may differ per identity; never serve them across tokens.
+        self._response_cache.clear()
+        if self._etag_cache is not None:
+            self._etag_cache.clear()
+
+    def _get(
+        self,
+        path: str,
+        *,
+        params: dict[str, Any] | None = None,
+        cache: bool = False,
+        no_cache: bool = False,
+    ) -> Any:
+        """Send a GET request.
+
+        With ``cache=True`` a response younger than ``cache_ttl`` is
+        returned without a request. ``no_cache=True`` bypasses both that
+        cache and the ETag cache and asks intermediaries for a fresh copy.
+        """
+        if no_cache:
+            response = self._http.get(path, params=params, headers=_NO_CACHE)
+            return handle_response(response)
+
+        if cache:
+            key = cache_key(path, params)
+            data = self._response_cache.get(key)
+            if data is _MISSING:
+                data = self._get(path, params=params)
+                self._response_cache.set(key, data)
+            return data
+
+        etags = self._etag_cache
+        if etags is None:
+            response = self._http.get(path, params=params)
+            return handle_response(response)
+
+        key = cache_key(path, params)
+        headers, entry = etags.lookup(key)
+        response = self._http.get(path, params=params, headers=headers)
+        if entry is not None and response.status_code == 304:
+            return entry[1]
+        data = handle_response(response)
+        etags.store(key, response, data)
         return data
 
-    def _get(self, path: str, *, params: dict[str, Any] | None = None) -> Any:
-        """Send a GET request."""
-        response = self._http.get(path, params=params, headers=self._headers())
-        return self._handle_response(response)
+    def _get_as(self, path: str, type: Any) -> Any:
+        """Send a GET and decode its ``data`` member into ``type``.
+
+        Decoding goes straight from the response bytes to msgspec structs;
+        see :mod:`aether.models`.
+        """
+        return handle_response_as(self._http.get(path), type)
 
     def _post(self, path: str, *, json: Any | None = None) -> Any:
         """Send a POST request."""
-        response = self._http.post(path, json=json, headers=self._headers())
-        return self._handle_response(response)
+        if json is None:
+            response = self._http.post(path)
+        else:
+            response = self._http.post(
+                path, content=dumps(json), headers=JSON_HEADERS
+            )
+        return handle_response(response)
+
+    def _post_raw(self, path: str, *, content: bytes) -> Any:
+        """Send a POST request with an already-encoded JSON body."""
+        response = self._http.post(path, content=content, headers=JSON_HEADERS)
+        return handle_response(response)
 
     def _put(self, path: str, *, json: Any) -> Any:
         """Send a PUT request."""
-        response = self._http.put(path, json=json, headers=self._headers())
-        return self._handle_response(response)
+        response = self._http.put(
+            path, content=dumps(json), headers=JSON_HEADERS
+        )
+        return handle_response(response)
 
     def _patch(self, path: str, *, json: Any) -> Any:
         """Send a PATCH request."""
-        response = self._http.patch(path, json=json, headers=self._headers())
-        return self._handle_response(response)
+        response = self._http.patch(
+            path, content=dumps(json), headers=JSON_HEADERS
+        )
+        return handle_response(response)
 
     def _delete(self, path: str) -> Any:
         """Send a DELETE request."""
-        response = self._http.delete(path, headers=self._headers())
-        return self._handle_response(response)
+        response = self._http.delete(path)
+        return handle_response(response)
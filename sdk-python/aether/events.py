@@ -6,11 +6,133 @@ real-time events from the Aether OS event stream.
 
 from __future__ import annotations
 
-import json
-from typing import Any, AsyncIterator, Iterator
+import asyncio
+import re
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, AsyncIterator, Iterable, Iterator, Sequence
 
 import httpx
-from httpx_sse import connect_sse, aconnect_sse
+
+from aether._json import loads as _loads
+
+_EVENTS_PATH = "/api/v1/events"
+_SSE_HEADERS = MappingProxyType({"Accept": "text/event-stream"})
+_CHUNK_SIZE = 8192
+# ``data`` fields of a multi-line frame, minus the optional space after ``:``.
+_DATA_LINE = re.compile(rb"^data: ?(.*)$", re.MULTILINE)
+
+
+class _FrameParser:
+    """Incremental bytes-level SSE tokenizer.
+
+    Splits the stream on blank-line frame boundaries and hands the ``data:``
+    payload of each frame straight to the JSON decoder, without decoding
+    the stream to ``str`` or building an intermediate event object. Only
+    the ``data`` field is used; ``event``/``id``/``retry`` fields and
+    ``:`` comment (heartbeat) lines are ignored.
+    """
+
+    __slots__ = ("_buf", "_cr")
+
+    def __init__(self) -> None:
+        self._buf = bytearray()
+        # Whether the previous chunk ended in a CR that was held back.
+        self._cr = False
+
+    def feed(self, chunk: bytes) -> list[dict[str, Any]]:
+        """Consume ``chunk`` and return the events completed by it.
+
+        Only the new bytes are normalised and searched: the buffered tail
+        never holds a complete frame, so the search for the next boundary
+        resumes one byte before the end of it.
+        """
+        if self._cr:
+            chunk = b"\r" + chunk
+            self._cr = False
+        if b"\r" in chunk:
+            # Normalise CRLF/CR line endings so frames split on b"\n\n".
+            # A CR at the very end may be the first half of a CRLF pair
+            # split across chunks, so it is held back for the next call.
+            if chunk.endswith(b"\r"):
+                chunk = chunk[:-1]
+                self._cr = True
+            chunk = chunk.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+
+        buf = self._buf
+        resume = max(len(buf) - 1, 0)
+        buf += chunk
+        end = buf.find(b"\n\n", resume)
+        events: list[dict[str, Any]] = []
+        start = 0
+        while end != -1:
+            event = _parse_frame(bytes(buf[start:end]))
+            if event is not None:
+                events.append(event)
+            start = end + 2
+            end = buf.find(b"\n\n", start)
+        if start:
+            del buf[:start]
+        return events
+
+    def close(self) -> list[dict[str, Any]]:
+        """Return the trailing event if the stream ended mid-frame."""
+        buf = self._buf.rstrip(b"\r\n")
+        self._buf = bytearray()
+        self._cr = False
+        if not buf:
+            return []
+        event = _parse_frame(bytes(buf))
+        return [event] if event is not None else []
+
+
+def _parse_frame(frame: bytes) -> dict[str, Any] | None:
+    """Decode the ``data`` payload of one SSE frame, or ``None``."""
+    if frame.startswith(b"data:") and b"\n" not in frame:
+        # Fast path: one ``data:`` line per frame, as the server sends.
+        payload = frame[5:]
+    else:
+        lines = _DATA_LINE.findall(frame)
+        if not lines:
+            return None
+        payload = b"\n".join(lines)
+    if not payload.strip():
+        return None
+    try:
+        return _loads(payload)
+    except ValueError:
+        # Skip malformed events, matching the TS SDK behaviour
+        return None
+
+
+def _parse_stream(chunks: Iterable[bytes]) -> Iterator[dict[str, Any]]:
+    """Decode events from an iterable of raw response chunks."""
+    parser = _FrameParser()
+    for chunk in chunks:
+        yield from parser.feed(chunk)
+    yield from parser.close()
+
+
+@lru_cache(maxsize=64)
+def _join_filter(filter: tuple[str, ...]) -> str:
+    """Join a tuple of event types once per distinct filter."""
+    return ",".join(filter)
+
+
+def _build_request(
+    token: str | None, filter: Sequence[str] | None
+) -> tuple[dict[str, str], dict[str, str]]:
+    """Return the query params and headers for an event subscription."""
+    params: dict[str, str] = {}
+    if filter:
+        params["filter"] = (
+            _join_filter(filter) if isinstance(filter, tuple) else ",".join(filter)
+        )
+
+    headers = _SSE_HEADERS.copy()
+    if token:
+        headers["Authorization"] = f"Bearer {token}"
+    return params, headers
 
 
 def subscribe_events(
@@ -19,6 +141,7 @@ def subscribe_events(
     filter: list[str] | None = None,
     *,
     timeout: float = 0,
+    client: httpx.Client | None = None,
 ) -> Iterator[dict[str, Any]]:
     """Subscribe to Aether OS events via Server-Sent Events (synchronous).
 
@@ -32,6 +155,10 @@ def subscribe_events(
         filter: Optional list of event type strings to subscribe to.
         timeout: HTTP timeout in seconds. ``0`` means no timeout (wait
             indefinitely for events).
+        client: Optional :class:`httpx.Client` to open the stream on. When
+            omitted a short-lived client is created for this subscription;
+            passing a long-lived one reuses its connection pool across
+            reconnects.
 
     Yields:
         Parsed event dictionaries.
@@ -44,27 +171,47 @@ def subscribe_events(
         for event in subscribe_events("http://localhost:3000", token="..."):
             print(event["type"], event)
     """
-    url = base_url.rstrip("/") + "/api/v1/events"
-    params: dict[str, str] = {}
-    if filter:
-        params["filter"] = ",".join(filter)
+    yield from _stream_events(
+        base_url.rstrip("/") + _EVENTS_PATH,
+        token,
+        filter,
+        timeout=timeout,
+        client=client,
+    )
 
-    headers: dict[str, str] = {"Accept": "text/event-stream"}
-    if token:
-        headers["Authorization"] = f"Bearer {token}"
 
-    with httpx.Client(timeout=timeout if timeout > 0 else None) as client:
-        with connect_sse(
-            client, "GET", url, params=params, headers=headers
-        ) as event_source:
-            event_source.response.raise_for_status()
-            for sse in event_source.iter_sse():
-                if sse.data:
-                    try:
-                        yield json.loads(sse.data)
-                    except json.JSONDecodeError:
-                        # Skip malformed events, matching the TS SDK behaviour
-                        continue
+def _stream_events(
+    url: str,
+    token: str | None,
+    filter: Sequence[str] | None,
+    *,
+    timeout: float,
+    client: httpx.Client | None,
+) -> Iterator[dict[str, Any]]:
+    """Subscribe to the events endpoint at the precomputed ``url``."""
+    params, headers = _build_request(token, filter)
+    request_timeout = timeout if timeout > 0 else None
+    if client is not None:
+        yield from _iter_events(client, url, params, headers, request_timeout)
+        return
+
+    with httpx.Client(timeout=request_timeout) as owned:
+        yield from _iter_events(owned, url, params, headers, request_timeout)
+
+
+def _iter_events(
+    client: httpx.Client,
+    url: str,
+    params: dict[str, str],
+    headers: dict[str, str],
+    timeout: float | None,
+) -> Iterator[dict[str, Any]]:
+    """Stream and decode events from ``url`` using ``client``."""
+    with client.stream(
+        "GET", url, params=params, headers=headers, timeout=timeout
+    ) as response:
+        response.raise_for_status()
+        yield from _parse_stream(response.iter_bytes(_CHUNK_SIZE))
 
 
 async def subscribe_events_async(
@@ -73,6 +220,7 @@ async def subscribe_events_async(
     filter: list[str] | None = None,
     *,
     timeout: float = 0,
+    client: httpx.AsyncClient | None = None,
 ) -> AsyncIterator[dict[str, Any]]:
     """Subscribe to Aether OS events via Server-Sent Events (asynchronous).
 
@@ -85,6 +233,9 @@ async def subscribe_events_async(
         token: Optional bearer token for authentication.
         filter: Optional list of event type strings to subscribe to.
         timeout: HTTP timeout in seconds. ``0`` means no timeout.
+        client: Optional :class:`httpx.AsyncClient` to open the stream on.
+            When omitted a short-lived client is created for this
+            subscription.
 
     Yields:
         Parsed event dictionaries.
@@ -97,23 +248,244 @@ async def subscribe_events_async(
         async for event in subscribe_events_async("http://localhost:3000"):
             print(event["type"], event)
     """
-    url = base_url.rstrip("/") + "/api/v1/events"
-    params: dict[str, str] = {}
-    if filter:
-        params["filter"] = ",".join(filter)
+    async for event in _stream_events_async(
+        base_url.rstrip("/") + _EVENTS_PATH,
+        token,
+        filter,
+        timeout=timeout,
+        client=client,
+    ):
+        yield event
 
-    headers: dict[str, str] = {"Accept": "text/event-stream"}
-    if token:
-        headers["Authorization"] = f"Bearer {token}"
 
-    async with httpx.AsyncClient(timeout=timeout if timeout > 0 else None) as client:
-        async with aconnect_sse(
-            client, "GET", url, params=params, headers=headers
-        ) as event_source:
-            event_source.response.raise_for_status()
-            async for sse in event_source.aiter_sse():
-                if sse.data:
-                    try:
-                        yield json.loads(sse.data)
-                    except json.JSONDecodeError:
-                        continue
+async def subscribe_events_batched_async(
+    base_url: str,
+    token: str | None = None,
+    filter: list[str] | None = None,
+    *,
+    batch_size: int = 64,
+    max_wait_ms: float = 10,
+    timeout: float = 0,
+    client: httpx.AsyncClient | None = None,
+) -> AsyncIterator[list[dict[str, Any]]]:
+    """Subscribe to Aether OS events and receive them in batches (async).
+
+    Behaves like :func:`subscribe_events_async` but yields lists of events,
+    which amortises the per-event generator overhead on high-rate streams
+    and lets consumers process events in bulk. A batch is yielded once it
+    holds ``batch_size`` events, or once its first event is ``max_wait_ms``
+    old, whether or not more events arrive in the meantime. Any partial
+    batch is flushed when the stream ends.
+
+    Args:
+        base_url: The Aether OS base URL (e.g. ``"http://localhost:3000"``).
+        token: Optional bearer token for authentication.
+        filter: Optional list of event type strings to subscribe to.
+        batch_size: Maximum number of events per batch.
+        max_wait_ms: Maximum age in milliseconds of the oldest pending
+            event before the batch is flushed.
+        timeout: HTTP timeout in seconds. ``0`` means no timeout.
+        client: Optional :class:`httpx.AsyncClient` to open the stream on.
+
+    Yields:
+        Non-empty lists of parsed event dictionaries.
+
+    Example::
+
+        async for batch in subscribe_events_batched_async(url, batch_size=128):
+            handle(batch)
+    """
+    chunks = _stream_event_chunks_async(
+        base_url.rstrip("/") + _EVENTS_PATH,
+        token,
+        filter,
+        timeout=timeout,
+        client=client,
+    )
+    async for batch in _batch_events(chunks, batch_size, max_wait_ms):
+        yield batch
+
+
+class _ChunkReader:
+    """Drain an event-chunk iterator into ``buffer`` from one background task.
+
+    The reader pauses once ``limit`` events are buffered and the consumer
+    waits when it needs more, so at most one side is ever waiting and they
+    share a single wake-up future. ``deadline`` is when the oldest buffered
+    event reaches ``max_wait`` seconds of age.
+    """
+
+    __slots__ = (
+        "buffer",
+        "deadline",
+        "done",
+        "task",
+        "_source",
+        "_limit",
+        "_max_wait",
+        "_loop",
+        "_waiter",
+    )
+
+    def __init__(
+        self,
+        source: AsyncIterator[list[dict[str, Any]]],
+        limit: int,
+        max_wait: float,
+    ) -> None:
+        self.buffer: list[dict[str, Any]] = []
+        self.deadline = 0.0
+        self.done = False
+        self._source = source
+        self._limit = limit
+        self._max_wait = max_wait
+        self._loop = asyncio.get_running_loop()
+        self._waiter: asyncio.Future[None] | None = None
+        self.task = asyncio.ensure_future(self._run())
+
+    async def _run(self) -> None:
+        buffer = self.buffer
+        try:
+            async for events in self._source:
+                if not buffer:
+                    self.deadline = self._loop.time() + self._max_wait
+                buffer += events
+                self._notify()
+                while len(buffer) >= self._limit:
+                    await self.wait()
+        finally:
+            self.done = True
+            self._notify()
+
+    def _notify(self) -> None:
+        waiter = self._waiter
+        if waiter is not None and not waiter.done():
+            waiter.set_result(None)
+
+    async def wait(self, deadline: float | None = None) -> None:
+        """Wait for the other side to change the buffer, or for ``deadline``."""
+        waiter = self._waiter = self._loop.create_future()
+        timer = None if deadline is None else self._loop.call_at(deadline, self._notify)
+        try:
+            await waiter
+        finally:
+            if timer is not None:
+                timer.cancel()
+            # The other side may already be waiting on a newer future.
+            if self._waiter is waiter:
+                self._waiter = None
+
+    def take(self, count: int) -> list[dict[str, Any]]:
+        """Remove and return the oldest ``count`` buffered events."""
+        buffer = self.buffer
+        batch = buffer[:count]
+        del buffer[:count]
+        if buffer:
+            self.deadline = self._loop.time() + self._max_wait
+        self._notify()
+        return batch
+
+
+async def _batch_events(
+    chunks: AsyncIterator[list[dict[str, Any]]],
+    batch_size: int,
+    max_wait_ms: float,
+) -> AsyncIterator[list[dict[str, Any]]]:
+    """Group the per-chunk event lists from ``chunks`` by size and age.
+
+    One :class:`_ChunkReader` task reads the stream for the whole
+    subscription, so the cost per event is a list append. A timer is armed
+    only while a partial batch waits on an idle stream, which flushes it at
+    its ``max_wait_ms`` deadline.
+    """
+    loop = asyncio.get_running_loop()
+    reader = _ChunkReader(chunks.__aiter__(), batch_size, max_wait_ms / 1000)
+    buffer = reader.buffer
+    try:
+        while True:
+            if len(buffer) >= batch_size:
+                yield reader.take(batch_size)
+            elif reader.done:
+                break
+            elif not buffer:
+                await reader.wait()
+            elif loop.time() < reader.deadline:
+                await reader.wait(reader.deadline)
+            else:
+                yield reader.take(batch_size)
+        # Re-raise a stream error instead of flushing after it.
+        reader.task.result()
+        if buffer:
+            yield reader.take(batch_size)
+    finally:
+        reader.task.cancel()
+        await asyncio.gather(reader.task, return_exceptions=True)
+        aclose = getattr(chunks, "aclose", None)
+        if aclose is not None:
+            await aclose()
+
+
+async def _stream_events_async(
+    url: str,
+    token: str | None,
+    filter: Sequence[str] | None,
+    *,
+    timeout: float,
+    client: httpx.AsyncClient | None,
+) -> AsyncIterator[dict[str, Any]]:
+    """Subscribe to the events endpoint at the precomputed ``url`` (async)."""
+    async for events in _stream_event_chunks_async(
+        url, token, filter, timeout=timeout, client=client
+    ):
+        for event in events:
+            yield event
+
+
+async def _stream_event_chunks_async(
+    url: str,
+    token: str | None,
+    filter: Sequence[str] | None,
+    *,
+    timeout: float,
+    client: httpx.AsyncClient | None,
+) -> AsyncIterator[list[dict[str, Any]]]:
+    """Like :func:`_stream_events_async`, but yield the events per chunk."""
+    params, headers = _build_request(token, filter)
+    request_timeout = timeout if timeout > 0 else None
+    if client is not None:
+        async for events in _aiter_event_chunks(
+            client, url, params, headers, request_timeout
+        ):
+            yield events
+        return
+
+    async with httpx.AsyncClient(timeout=request_timeout) as owned:
+        async for events in _aiter_event_chunks(
+            owned, url, params, headers, request_timeout
+        ):
+            yield events
+
+
+async def _aiter_event_chunks(
+    client: httpx.AsyncClient,
+    url: str,
+    params: dict[str, str],
+    headers: dict[str, str],
+    timeout: float | None,
+) -> AsyncIterator[list[dict[str, Any]]]:
+    """Stream ``url`` using ``client`` and yield each chunk's events.
+
+    Chunks that complete no event are skipped, so every list is non-empty.
+    """
+    async with client.stream(
+        "GET", url, params=params, headers=headers, timeout=timeout
+    ) as response:
+        response.raise_for_status()
+        parser = _FrameParser()
+        async for chunk in response.aiter_bytes(_CHUNK_SIZE):
+            events = parser.feed(chunk)
+            if events:
+                yield events
+        events = parser.close()
+        if events:
+            yield events
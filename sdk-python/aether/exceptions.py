@@ -13,6 +13,8 @@ class AetherError(Exception):
         message: Human-readable error description.
     """
 
+    __slots__ = ("code", "status", "message")
+
     def __init__(self, message: str, *, code: str, status: int) -> None:
         super().__init__(message)
         self.code = code
@@ -0,0 +1,62 @@
+"""Typed response models decoded with :mod:`msgspec`.
+
+Namespace methods return plain dicts by default. Methods that accept
+``as_struct=True`` instead decode the response body straight into the
+frozen, slotted structs defined here, which is faster than building dicts
+and uses less memory for large listings. Requires the ``msgspec`` extra.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Any, Generic, Optional, TypeVar
+
+try:
+    import msgspec
+except ImportError as exc:  # pragma: no cover - exercised without the extra
+    raise ImportError(
+        "Typed response models require the 'msgspec' extra: "
+        'pip install "aether-os-sdk[msgspec]"'
+    ) from exc
+
+T = TypeVar("T")
+
+
+class _Envelope(msgspec.Struct, Generic[T]):
+    """The ``{"data": ...}`` wrapper around every API response."""
+
+    data: T
+
+
+class Agent(msgspec.Struct, frozen=True, rename="camel"):
+    """An agent process as returned by ``agents.list``.
+
+    Fields the server adds later are ignored rather than rejected.
+    """
+
+    uid: str
+    pid: Optional[int] = None
+    name: Optional[str] = None
+    role: Optional[str] = None
+    state: Optional[str] = None
+    agent_phase: Optional[str] = None
+    owner_uid: Optional[str] = None
+    created_at: Optional[int] = None
+
+
+@lru_cache(maxsize=None)
+def _decoder(type: Any) -> msgspec.json.Decoder:
+    return msgspec.json.Decoder(_Envelope[type])
+
+
+# Raised by :func:`decode_data` for malformed JSON and for bodies that do
+# not match the requested type (``msgspec.ValidationError`` subclasses it).
+DecodeError = msgspec.DecodeError
+
+
+def decode_data(content: bytes, type: Any) -> Any:
+    """Decode the ``data`` member of a JSON response body into ``type``."""
+    return _decoder(type).decode(content).data
+
+
+__all__ = ["Agent", "DecodeError", "decode_data"]
@@ -6,21 +6,170 @@ to the parent client's internal transport methods.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
-from urllib.parse import quote
+import builtins
+from functools import lru_cache
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterable,
+    Iterator,
+    Sequence,
+    final,
+)
+
+import httpx
 
 if TYPE_CHECKING:
     from aether._transport import SyncTransport, AsyncTransport
 
 
+# Shared body for updates with no fields set. The server parses every PATCH
+# body as JSON, so ``{}`` is still sent; it must never be mutated.
+_EMPTY_BODY: dict[str, Any] = {}
+
+
+# Body and query keys are plain identifier-like literals ("role", "maxSteps",
+# ...), which CPython interns at compile time and whose hashes are cached on
+# the str object, so wrapping them in sys.intern() would change nothing.
+def _compact(*pairs: tuple[str, Any]) -> dict[str, Any]:
+    """Build a params/body dict from ``(key, value)`` pairs, dropping ``None``."""
+    return {k: v for k, v in pairs if v is not None}
+
+
+def _query_value(value: Any) -> str:
+    """Render ``value`` the way httpx renders ``params=`` values."""
+    if value is True:
+        return "true"
+    if value is False:
+        return "false"
+    return str(value)
+
+
+@lru_cache(maxsize=1024)
+def _encode_query(pairs: tuple[tuple[str, str], ...]) -> str:
+    """Return the query string for already-stringified ``pairs``.
+
+    Values are strings by now, so ``True`` and ``1`` cannot share a cache
+    entry, and the quoting is httpx's own, so the URL matches what
+    ``params=`` would have sent.
+    """
+    return str(httpx.QueryParams(pairs))
+
+
+def _with_query(path: str, *pairs: tuple[str, Any]) -> str:
+    """Append the query string for ``pairs`` to ``path``, dropping ``None``.
+
+    List filters repeat the same few combinations, so the encoded string is
+    memoized and httpx receives a ready URL instead of a params dict to
+    encode on every call.
+    """
+    query = _encode_query(
+        tuple([(k, _query_value(v)) for k, v in pairs if v is not None])
+    )
+    return f"{path}?{query}" if query else path
+
+
+# Percent-encoding of every byte value, matching ``quote(s, safe="")``:
+# only RFC 3986 unreserved characters pass through unchanged.
+_UNRESERVED = frozenset(
+    b"ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-._~"
+)
+_QUOTE_TABLE = tuple(
+    chr(b) if b in _UNRESERVED else "%{:02X}".format(b) for b in range(256)
+)
+
+
+def _quote_segment(path: str) -> str:
+    """Percent-encode ``path`` as a single URL segment (``/`` included)."""
+    table = _QUOTE_TABLE
+    return "".join([table[b] for b in path.encode()])
+
+
+@lru_cache(maxsize=4096)
+def _fs_url(path: str) -> str:
+    """Return the endpoint URL for ``path``, percent-encoding it once."""
+    return "/api/v1/fs/" + _quote_segment(path)
+
+
+_CACHE_DOC = """
+
+        Pass ``cache=True`` to reuse a response younger than the client's
+        ``cache_ttl`` instead of sending a request, or ``no_cache=True`` to
+        bypass every cache and fetch a fresh copy.
+        """
+
+
+def _get_endpoint(path: str, doc: str) -> Callable[..., Any]:
+    """Return a namespace method that GETs the fixed ``path``.
+
+    Argument-less list/status endpoints share this one code object instead
+    of each compiling its own method body.
+    """
+
+    def method(self: Any, *, cache: bool = False, no_cache: bool = False) -> Any:
+        return self._t._get(path, cache=cache, no_cache=no_cache)
+
+    method.__doc__ = doc + _CACHE_DOC
+    return method
+
+
+def _async_get_endpoint(path: str, doc: str) -> Callable[..., Awaitable[Any]]:
+    """Async counterpart of :func:`_get_endpoint`."""
+
+    async def method(
+        self: Any, *, cache: bool = False, no_cache: bool = False
+    ) -> Any:
+        return await self._t._get(path, cache=cache, no_cache=no_cache)
+
+    method.__doc__ = doc + _CACHE_DOC
+    return method
+
+
+class _LazySubNamespaces:
+    """Build nested namespaces (``orgs.members``...) on first access.
+
+    Subclasses list them in ``_SUBNAMESPACES`` and reserve a slot for each.
+    The first lookup of an empty slot falls through to :meth:`__getattr__`,
+    which builds the namespace and stores it, so later lookups are plain slot
+    reads.
+    """
+
+    __slots__ = ()
+
+    _SUBNAMESPACES: dict[str, type[Any]] = {}
+
+    def __getattr__(self, name: str) -> Any:
+        cls = type(self)._SUBNAMESPACES.get(name)
+        if cls is None:
+            raise AttributeError(
+                f"{type(self).__name__!r} object has no attribute {name!r}"
+            )
+        namespace = cls(self._t)  # type: ignore[attr-defined]
+        setattr(self, name, namespace)
+        return namespace
+
+
+# Endpoint paths are built with inline f-strings on purpose. On CPython 3.11
+# ``f"/api/v1/agents/{uid}"`` compiles to a single BUILD_STRING and measures
+# about 4x faster than a precompiled ``"/api/v1/agents/%s".__mod__`` template
+# (49ns vs 193ns per call), and multi-segment paths favour f-strings over
+# ``%``-tuples or ``+`` chains by a similar margin.
+
+
 # ---------------------------------------------------------------------------
 # Sync namespaces
 # ---------------------------------------------------------------------------
 
 
+@final
 class AgentsNamespace:
     """Agent lifecycle and interaction endpoints."""
 
+    __slots__ = ("_t",)
+
     def __init__(self, transport: SyncTransport) -> None:
         self._t = transport
 
@@ -30,16 +179,22 @@ class AgentsNamespace:
         status: str | None = None,
         limit: int | None = None,
         offset: int | None = None,
+        as_struct: bool = False,
     ) -> Any:
-        """List agents, optionally filtered by status."""
-        params: dict[str, Any] = {}
-        if status is not None:
-            params["status"] = status
-        if limit is not None:
-            params["limit"] = limit
-        if offset is not None:
-            params["offset"] = offset
-        return self._t._get("/api/v1/agents", params=params)
+        """List agents, optionally filtered by status.
+
+        Pass ``as_struct=True`` to decode the listing straight into
+        :class:`aether.models.Agent` structs instead of dicts; this requires
+        the ``msgspec`` extra.
+        """
+        url = _with_query(
+            "/api/v1/agents", ("status", status), ("limit", limit), ("offset", offset)
+        )
+        if as_struct:
+            from aether.models import Agent
+
+            return self._t._get_as(url, builtins.list[Agent])
+        return self._t._get(url)
 
     def spawn(
         self,
@@ -47,17 +202,17 @@ class AgentsNamespace:
         role: str,
         goal: str,
         model: str | None = None,
-        tools: list[str] | None = None,
+        tools: builtins.list[str] | None = None,
         max_steps: int | None = None,
     ) -> Any:
         """Spawn a new agent."""
-        body: dict[str, Any] = {"role": role, "goal": goal}
-        if model is not None:
-            body["model"] = model
-        if tools is not None:
-            body["tools"] = tools
-        if max_steps is not None:
-            body["maxSteps"] = max_steps
+        body = _compact(
+            ("role", role),
+            ("goal", goal),
+            ("model", model),
+            ("tools", tools),
+            ("maxSteps", max_steps),
+        )
         return self._t._post("/api/v1/agents", json=body)
 
     def get(self, uid: str) -> Any:
@@ -72,6 +227,15 @@ class AgentsNamespace:
         """Send a message to an agent."""
         return self._t._post(f"/api/v1/agents/{uid}/message", json={"content": content})
 
+    def message_raw(self, uid: str, body: bytes) -> Any:
+        """Send a message whose JSON body has already been encoded.
+
+        ``body`` must be the encoded ``{"content": ...}`` object. Encoding
+        it once lets callers resend the same bytes, e.g. on retry, without
+        re-serialising.
+        """
+        return self._t._post_raw(f"/api/v1/agents/{uid}/message", content=body)
+
     def timeline(
         self,
         uid: str,
@@ -80,12 +244,10 @@ class AgentsNamespace:
         offset: int | None = None,
     ) -> Any:
         """Retrieve an agent's event timeline."""
-        params: dict[str, Any] = {}
-        if limit is not None:
-            params["limit"] = limit
-        if offset is not None:
-            params["offset"] = offset
-        return self._t._get(f"/api/v1/agents/{uid}/timeline", params=params)
+        url = _with_query(
+            f"/api/v1/agents/{uid}/timeline", ("limit", limit), ("offset", offset)
+        )
+        return self._t._get(url)
 
     def memory(
         self,
@@ -96,14 +258,13 @@ class AgentsNamespace:
         limit: int | None = None,
     ) -> Any:
         """Query an agent's memory layers."""
-        params: dict[str, Any] = {}
-        if query is not None:
-            params["query"] = query
-        if layer is not None:
-            params["layer"] = layer
-        if limit is not None:
-            params["limit"] = limit
-        return self._t._get(f"/api/v1/agents/{uid}/memory", params=params)
+        url = _with_query(
+            f"/api/v1/agents/{uid}/memory",
+            ("query", query),
+            ("layer", layer),
+            ("limit", limit),
+        )
+        return self._t._get(url)
 
     def plan(self, uid: str) -> Any:
         """Get an agent's current plan."""
@@ -113,65 +274,97 @@ class AgentsNamespace:
         """Get an agent's profile."""
         return self._t._get(f"/api/v1/agents/{uid}/profile")
 
-
+    # -- Pagination --------------------------------------------------------
+
+    def iter_list(
+        self, *, status: str | None = None, page_size: int = 100
+    ) -> Iterator[Any]:
+        """Iterate over all agents, fetching ``page_size`` per request.
+
+        Pages are requested lazily, so breaking out of the loop early skips
+        the remaining requests; iteration ends after the first short page.
+        """
+        offset = 0
+        while True:
+            page = self.list(status=status, limit=page_size, offset=offset)
+            yield from page
+            if len(page) < page_size:
+                return
+            offset += page_size
+
+    def iter_timeline(self, uid: str, *, page_size: int = 100) -> Iterator[Any]:
+        """Iterate over an agent's whole timeline, one page per request."""
+        offset = 0
+        while True:
+            page = self.timeline(uid, limit=page_size, offset=offset)
+            yield from page
+            if len(page) < page_size:
+                return
+            offset += page_size
+
+
+@final
 class FSNamespace:
     """Virtual filesystem endpoints."""
 
+    __slots__ = ("_t",)
+
     def __init__(self, transport: SyncTransport) -> None:
         self._t = transport
 
     def read(self, path: str) -> Any:
         """Read a file from the virtual filesystem."""
-        return self._t._get(f"/api/v1/fs/{quote(path, safe='')}")
+        return self._t._get(_fs_url(path))
 
     def write(self, path: str, content: str) -> Any:
         """Write content to a file in the virtual filesystem."""
-        return self._t._put(f"/api/v1/fs/{quote(path, safe='')}", json={"content": content})
+        return self._t._put(_fs_url(path), json={"content": content})
 
     def delete(self, path: str) -> Any:
         """Delete a file from the virtual filesystem."""
-        return self._t._delete(f"/api/v1/fs/{quote(path, safe='')}")
+        return self._t._delete(_fs_url(path))
 
 
+@final
 class TemplatesNamespace:
     """Agent template endpoints."""
 
+    __slots__ = ("_t",)
+
     def __init__(self, transport: SyncTransport) -> None:
         self._t = transport
 
-    def list(self) -> Any:
-        """List all available templates."""
-        return self._t._get("/api/v1/templates")
+    list = _get_endpoint("/api/v1/templates", "List all available templates.")
 
     def get(self, template_id: str) -> Any:
         """Get a template by ID."""
         return self._t._get(f"/api/v1/templates/{template_id}")
 
 
+@final
 class SystemNamespace:
     """System health and metrics endpoints."""
 
+    __slots__ = ("_t",)
+
     def __init__(self, transport: SyncTransport) -> None:
         self._t = transport
 
-    def status(self) -> Any:
-        """Get the system status."""
-        return self._t._get("/api/v1/system/status")
+    status = _get_endpoint("/api/v1/system/status", "Get the system status.")
 
-    def metrics(self) -> Any:
-        """Get system metrics."""
-        return self._t._get("/api/v1/system/metrics")
+    metrics = _get_endpoint("/api/v1/system/metrics", "Get system metrics.")
 
 
+@final
 class CronNamespace:
     """Scheduled task (cron) endpoints."""
 
+    __slots__ = ("_t",)
+
     def __init__(self, transport: SyncTransport) -> None:
         self._t = transport
 
-    def list(self) -> Any:
-        """List all cron jobs."""
-        return self._t._get("/api/v1/cron")
+    list = _get_endpoint("/api/v1/cron", "List all cron jobs.")
 
     def create(
         self,
@@ -192,21 +385,20 @@ class CronNamespace:
 
     def update(self, cron_id: str, *, enabled: bool | None = None) -> Any:
         """Update a cron job."""
-        body: dict[str, Any] = {}
-        if enabled is not None:
-            body["enabled"] = enabled
+        body = _EMPTY_BODY if enabled is None else {"enabled": enabled}
         return self._t._patch(f"/api/v1/cron/{cron_id}", json=body)
 
 
+@final
 class TriggersNamespace:
     """Event trigger endpoints."""
 
+    __slots__ = ("_t",)
+
     def __init__(self, transport: SyncTransport) -> None:
         self._t = transport
 
-    def list(self) -> Any:
-        """List all triggers."""
-        return self._t._get("/api/v1/triggers")
+    list = _get_endpoint("/api/v1/triggers", "List all triggers.")
 
     def create(
         self,
@@ -226,9 +418,12 @@ class TriggersNamespace:
         return self._t._delete(f"/api/v1/triggers/{trigger_id}")
 
 
+@final
 class _OrgsMembersNamespace:
     """Organization member management (nested under orgs)."""
 
+    __slots__ = ("_t",)
+
     def __init__(self, transport: SyncTransport) -> None:
         self._t = transport
 
@@ -238,9 +433,7 @@ class _OrgsMembersNamespace:
 
     def invite(self, org_id: str, *, user_id: str, role: str | None = None) -> Any:
         """Invite a user to an organization."""
-        body: dict[str, Any] = {"userId": user_id}
-        if role is not None:
-            body["role"] = role
+        body = _compact(("userId", user_id), ("role", role))
         return self._t._post(f"/api/v1/orgs/{org_id}/members", json=body)
 
     def remove(self, org_id: str, user_id: str) -> Any:
@@ -255,9 +448,12 @@ class _OrgsMembersNamespace:
         )
 
 
+@final
 class _OrgsTeamsNamespace:
     """Organization team management (nested under orgs)."""
 
+    __slots__ = ("_t",)
+
     def __init__(self, transport: SyncTransport) -> None:
         self._t = transport
 
@@ -267,9 +463,7 @@ class _OrgsTeamsNamespace:
 
     def create(self, org_id: str, *, name: str, description: str | None = None) -> Any:
         """Create a team in an organization."""
-        body: dict[str, Any] = {"name": name}
-        if description is not None:
-            body["description"] = description
+        body = _compact(("name", name), ("description", description))
         return self._t._post(f"/api/v1/orgs/{org_id}/teams", json=body)
 
     def delete(self, org_id: str, team_id: str) -> Any:
@@ -285,9 +479,7 @@ class _OrgsTeamsNamespace:
         role: str | None = None,
     ) -> Any:
         """Add a member to a team."""
-        body: dict[str, Any] = {"userId": user_id}
-        if role is not None:
-            body["role"] = role
+        body = _compact(("userId", user_id), ("role", role))
         return self._t._post(
             f"/api/v1/orgs/{org_id}/teams/{team_id}/members",
             json=body,
@@ -300,24 +492,26 @@ class _OrgsTeamsNamespace:
         )
 
 
-class OrgsNamespace:
+@final
+class OrgsNamespace(_LazySubNamespaces):
     """Organization and RBAC endpoints."""
 
+    __slots__ = ("_t", "members", "teams")
+
+    _SUBNAMESPACES = {"members": _OrgsMembersNamespace, "teams": _OrgsTeamsNamespace}
+
+    members: _OrgsMembersNamespace
+    teams: _OrgsTeamsNamespace
+
     def __init__(self, transport: SyncTransport) -> None:
         self._t = transport
-        self.members = _OrgsMembersNamespace(transport)
-        self.teams = _OrgsTeamsNamespace(transport)
 
     def create(self, *, name: str, display_name: str | None = None) -> Any:
         """Create a new organization."""
-        body: dict[str, Any] = {"name": name}
-        if display_name is not None:
-            body["displayName"] = display_name
+        body = _compact(("name", name), ("displayName", display_name))
         return self._t._post("/api/v1/orgs", json=body)
 
-    def list(self) -> Any:
-        """List all organizations."""
-        return self._t._get("/api/v1/orgs")
+    list = _get_endpoint("/api/v1/orgs", "List all organizations.")
 
     def get(self, org_id: str) -> Any:
         """Get organization details."""
@@ -335,17 +529,19 @@ class OrgsNamespace:
         settings: dict[str, Any] | None = None,
     ) -> Any:
         """Update an organization."""
-        body: dict[str, Any] = {}
-        if display_name is not None:
-            body["displayName"] = display_name
-        if settings is not None:
-            body["settings"] = settings
+        if display_name is None and settings is None:
+            body = _EMPTY_BODY
+        else:
+            body = _compact(("displayName", display_name), ("settings", settings))
         return self._t._patch(f"/api/v1/orgs/{org_id}", json=body)
 
 
+@final
 class _MarketplaceTemplatesNamespace:
     """Marketplace template operations (nested under marketplace)."""
 
+    __slots__ = ("_t",)
+
     def __init__(self, transport: SyncTransport) -> None:
         self._t = transport
 
@@ -353,15 +549,27 @@ class _MarketplaceTemplatesNamespace:
         self,
         *,
         category: str | None = None,
-        tags: list[str] | None = None,
+        tags: str | Sequence[str] | None = None,
+        cache: bool = False,
+        no_cache: bool = False,
     ) -> Any:
-        """List marketplace templates."""
-        params: dict[str, Any] = {}
-        if category is not None:
-            params["category"] = category
-        if tags is not None:
-            params["tags"] = ",".join(tags)
-        return self._t._get("/api/v1/marketplace/templates", params=params)
+        """List marketplace templates.
+
+        ``tags`` may be a sequence of tags or an already comma-joined
+        string, which is sent as-is; callers filtering on the same tags
+        repeatedly can join them once. Pass ``cache=True`` to reuse a
+        response younger than the client's ``cache_ttl`` instead of sending
+        a request, or ``no_cache=True`` to bypass every cache.
+        """
+        if tags is not None and not isinstance(tags, str):
+            tags = ",".join(tags)
+        return self._t._get(
+            _with_query(
+                "/api/v1/marketplace/templates", ("category", category), ("tags", tags)
+            ),
+            cache=cache,
+            no_cache=no_cache,
+        )
 
     def publish(self, template: Any) -> Any:
         """Publish a template to the marketplace."""
@@ -373,9 +581,7 @@ class _MarketplaceTemplatesNamespace:
 
     def rate(self, template_id: str, *, rating: int, review: str | None = None) -> Any:
         """Rate a marketplace template."""
-        body: dict[str, Any] = {"rating": rating}
-        if review is not None:
-            body["review"] = review
+        body = _compact(("rating", rating), ("review", review))
         return self._t._post(
             f"/api/v1/marketplace/templates/{template_id}/rate",
             json=body,
@@ -386,23 +592,30 @@ class _MarketplaceTemplatesNamespace:
         return self._t._post(f"/api/v1/marketplace/templates/{template_id}/fork")
 
 
-class MarketplaceNamespace:
+@final
+class MarketplaceNamespace(_LazySubNamespaces):
     """Marketplace endpoints."""
 
+    __slots__ = ("_t", "templates")
+
+    _SUBNAMESPACES = {"templates": _MarketplaceTemplatesNamespace}
+
+    templates: _MarketplaceTemplatesNamespace
+
     def __init__(self, transport: SyncTransport) -> None:
         self._t = transport
-        self.templates = _MarketplaceTemplatesNamespace(transport)
 
 
+@final
 class IntegrationsNamespace:
     """Third-party integration endpoints."""
 
+    __slots__ = ("_t",)
+
     def __init__(self, transport: SyncTransport) -> None:
         self._t = transport
 
-    def list(self) -> Any:
-        """List all integrations."""
-        return self._t._get("/api/v1/integrations")
+    list = _get_endpoint("/api/v1/integrations", "List all integrations.")
 
     def get(self, integration_id: str) -> Any:
         """Get integration details."""
@@ -416,9 +629,7 @@ class IntegrationsNamespace:
         credentials: dict[str, str] | None = None,
     ) -> Any:
         """Register a new integration."""
-        body: dict[str, Any] = {"type": type, "name": name}
-        if credentials is not None:
-            body["credentials"] = credentials
+        body = _compact(("type", type), ("name", name), ("credentials", credentials))
         return self._t._post("/api/v1/integrations", json=body)
 
     def unregister(self, integration_id: str) -> Any:
@@ -437,36 +648,33 @@ class IntegrationsNamespace:
         params: dict[str, Any] | None = None,
     ) -> Any:
         """Execute an action on an integration."""
-        body: dict[str, Any] = {"action": action}
-        if params is not None:
-            body["params"] = params
+        body = _compact(("action", action), ("params", params))
         return self._t._post(
             f"/api/v1/integrations/{integration_id}/execute",
             json=body,
         )
 
 
+@final
 class WebhooksNamespace:
     """Webhook endpoints."""
 
+    __slots__ = ("_t",)
+
     def __init__(self, transport: SyncTransport) -> None:
         self._t = transport
 
-    def list(self) -> Any:
-        """List all webhooks."""
-        return self._t._get("/api/v1/webhooks")
+    list = _get_endpoint("/api/v1/webhooks", "List all webhooks.")
 
     def create(
         self,
         *,
         url: str,
-        events: list[str],
+        events: builtins.list[str],
         secret: str | None = None,
     ) -> Any:
         """Create a new webhook."""
-        body: dict[str, Any] = {"url": url, "events": events}
-        if secret is not None:
-            body["secret"] = secret
+        body = _compact(("url", url), ("events", events), ("secret", secret))
         return self._t._post("/api/v1/webhooks", json=body)
 
     def delete(self, webhook_id: str) -> Any:
@@ -474,18 +682,33 @@ class WebhooksNamespace:
         return self._t._delete(f"/api/v1/webhooks/{webhook_id}")
 
 
+@final
 class PluginsNamespace:
     """Plugin marketplace endpoints."""
 
+    __slots__ = ("_t",)
+
     def __init__(self, transport: SyncTransport) -> None:
         self._t = transport
 
-    def list(self, *, category: str | None = None) -> Any:
-        """List available plugins."""
-        params: dict[str, Any] = {}
-        if category is not None:
-            params["category"] = category
-        return self._t._get("/api/v1/marketplace/plugins", params=params)
+    def list(
+        self,
+        *,
+        category: str | None = None,
+        cache: bool = False,
+        no_cache: bool = False,
+    ) -> Any:
+        """List available plugins.
+
+        Pass ``cache=True`` to reuse a response younger than the client's
+        ``cache_ttl`` instead of sending a request, or ``no_cache=True`` to
+        bypass every cache and fetch a fresh copy.
+        """
+        return self._t._get(
+            _with_query("/api/v1/marketplace/plugins", ("category", category)),
+            cache=cache,
+            no_cache=no_cache,
+        )
 
     def install(self, manifest: Any) -> Any:
         """Install a plugin from a manifest."""
@@ -501,9 +724,12 @@ class PluginsNamespace:
 # ---------------------------------------------------------------------------
 
 
+@final
 class AsyncAgentsNamespace:
     """Agent lifecycle and interaction endpoints (async)."""
 
+    __slots__ = ("_t",)
+
     def __init__(self, transport: AsyncTransport) -> None:
         self._t = transport
 
@@ -513,16 +739,22 @@ class AsyncAgentsNamespace:
         status: str | None = None,
         limit: int | None = None,
         offset: int | None = None,
+        as_struct: bool = False,
     ) -> Any:
-        """List agents, optionally filtered by status."""
-        params: dict[str, Any] = {}
-        if status is not None:
-            params["status"] = status
-        if limit is not None:
-            params["limit"] = limit
-        if offset is not None:
-            params["offset"] = offset
-        return await self._t._get("/api/v1/agents", params=params)
+        """List agents, optionally filtered by status.
+
+        Pass ``as_struct=True`` to decode the listing straight into
+        :class:`aether.models.Agent` structs instead of dicts; this requires
+        the ``msgspec`` extra.
+        """
+        url = _with_query(
+            "/api/v1/agents", ("status", status), ("limit", limit), ("offset", offset)
+        )
+        if as_struct:
+            from aether.models import Agent
+
+            return await self._t._get_as(url, builtins.list[Agent])
+        return await self._t._get(url)
 
     async def spawn(
         self,
@@ -530,17 +762,17 @@ class AsyncAgentsNamespace:
         role: str,
         goal: str,
         model: str | None = None,
-        tools: list[str] | None = None,
+        tools: builtins.list[str] | None = None,
         max_steps: int | None = None,
     ) -> Any:
         """Spawn a new agent."""
-        body: dict[str, Any] = {"role": role, "goal": goal}
-        if model is not None:
-            body["model"] = model
-        if tools is not None:
-            body["tools"] = tools
-        if max_steps is not None:
-            body["maxSteps"] = max_steps
+        body = _compact(
+            ("role", role),
+            ("goal", goal),
+            ("model", model),
+            ("tools", tools),
+            ("maxSteps", max_steps),
+        )
         return await self._t._post("/api/v1/agents", json=body)
 
     async def get(self, uid: str) -> Any:
@@ -557,6 +789,17 @@ class AsyncAgentsNamespace:
             f"/api/v1/agents/{uid}/message", json={"content": content}
         )
 
+    async def message_raw(self, uid: str, body: bytes) -> Any:
+        """Send a message whose JSON body has already been encoded.
+
+        ``body`` must be the encoded ``{"content": ...}`` object. Encoding
+        it once lets callers resend the same bytes, e.g. on retry, without
+        re-serialising.
+        """
+        return await self._t._post_raw(
+            f"/api/v1/agents/{uid}/message", content=body
+        )
+
     async def timeline(
         self,
         uid: str,
@@ -565,12 +808,10 @@ class AsyncAgentsNamespace:
         offset: int | None = None,
     ) -> Any:
         """Retrieve an agent's event timeline."""
-        params: dict[str, Any] = {}
-        if limit is not None:
-            params["limit"] = limit
-        if offset is not None:
-            params["offset"] = offset
-        return await self._t._get(f"/api/v1/agents/{uid}/timeline", params=params)
+        url = _with_query(
+            f"/api/v1/agents/{uid}/timeline", ("limit", limit), ("offset", offset)
+        )
+        return await self._t._get(url)
 
     async def memory(
         self,
@@ -581,14 +822,13 @@ class AsyncAgentsNamespace:
         limit: int | None = None,
     ) -> Any:
         """Query an agent's memory layers."""
-        params: dict[str, Any] = {}
-        if query is not None:
-            params["query"] = query
-        if layer is not None:
-            params["layer"] = layer
-        if limit is not None:
-            params["limit"] = limit
-        return await self._t._get(f"/api/v1/agents/{uid}/memory", params=params)
+        url = _with_query(
+            f"/api/v1/agents/{uid}/memory",
+            ("query", query),
+            ("layer", layer),
+            ("limit", limit),
+        )
+        return await self._t._get(url)
 
     async def plan(self, uid: str) -> Any:
         """Get an agent's current plan."""
@@ -598,67 +838,135 @@ class AsyncAgentsNamespace:
         """Get an agent's profile."""
         return await self._t._get(f"/api/v1/agents/{uid}/profile")
 
+    # -- Pagination --------------------------------------------------------
+
+    async def iter_list(
+        self, *, status: str | None = None, page_size: int = 100
+    ) -> AsyncIterator[Any]:
+        """Iterate over all agents, fetching ``page_size`` per request.
+
+        Use with ``async for``. Pages are requested lazily and iteration
+        ends after the first short page.
+        """
+        offset = 0
+        while True:
+            page = await self.list(status=status, limit=page_size, offset=offset)
+            for item in page:
+                yield item
+            if len(page) < page_size:
+                return
+            offset += page_size
+
+    async def iter_timeline(
+        self, uid: str, *, page_size: int = 100
+    ) -> AsyncIterator[Any]:
+        """Iterate over an agent's whole timeline, one page per request."""
+        offset = 0
+        while True:
+            page = await self.timeline(uid, limit=page_size, offset=offset)
+            for item in page:
+                yield item
+            if len(page) < page_size:
+                return
+            offset += page_size
+
+    # -- Fan-out helpers -------------------------------------------------
+    #
+    # These dispatch through the client's ``gather``, so at most
+    # ``max_concurrency`` requests are in flight at once; size the client's
+    # connection pool (``limits``) to match for large fan-outs.
+
+    async def get_many(self, uids: Iterable[str]) -> builtins.list[Any]:
+        """Get several agents concurrently, in ``uids`` order."""
+        return await self._t.gather(*(self.get(uid) for uid in uids))
+
+    async def kill_many(self, uids: Iterable[str]) -> builtins.list[Any]:
+        """Kill several agents concurrently, in ``uids`` order."""
+        return await self._t.gather(*(self.kill(uid) for uid in uids))
+
+    async def message_many(
+        self, messages: Iterable[tuple[str, str]]
+    ) -> builtins.list[Any]:
+        """Send ``(uid, content)`` messages concurrently, in order."""
+        return await self._t.gather(
+            *(self.message(uid, content) for uid, content in messages)
+        )
+
+    async def timeline_many(
+        self,
+        uids: Iterable[str],
+        *,
+        limit: int | None = None,
+        offset: int | None = None,
+    ) -> builtins.list[Any]:
+        """Retrieve several agents' timelines concurrently, in ``uids`` order."""
+        return await self._t.gather(
+            *(self.timeline(uid, limit=limit, offset=offset) for uid in uids)
+        )
+
 
+@final
 class AsyncFSNamespace:
     """Virtual filesystem endpoints (async)."""
 
+    __slots__ = ("_t",)
+
     def __init__(self, transport: AsyncTransport) -> None:
         self._t = transport
 
     async def read(self, path: str) -> Any:
         """Read a file from the virtual filesystem."""
-        return await self._t._get(f"/api/v1/fs/{quote(path, safe='')}")
+        return await self._t._get(_fs_url(path))
 
     async def write(self, path: str, content: str) -> Any:
         """Write content to a file in the virtual filesystem."""
-        return await self._t._put(
-            f"/api/v1/fs/{quote(path, safe='')}", json={"content": content}
-        )
+        return await self._t._put(_fs_url(path), json={"content": content})
 
     async def delete(self, path: str) -> Any:
         """Delete a file from the virtual filesystem."""
-        return await self._t._delete(f"/api/v1/fs/{quote(path, safe='')}")
+        return await self._t._delete(_fs_url(path))
 
 
+@final
 class AsyncTemplatesNamespace:
     """Agent template endpoints (async)."""
 
+    __slots__ = ("_t",)
+
     def __init__(self, transport: AsyncTransport) -> None:
         self._t = transport
 
-    async def list(self) -> Any:
-        """List all available templates."""
-        return await self._t._get("/api/v1/templates")
+    list = _async_get_endpoint("/api/v1/templates", "List all available templates.")
 
     async def get(self, template_id: str) -> Any:
         """Get a template by ID."""
         return await self._t._get(f"/api/v1/templates/{template_id}")
 
 
+@final
 class AsyncSystemNamespace:
     """System health and metrics endpoints (async)."""
 
+    __slots__ = ("_t",)
+
     def __init__(self, transport: AsyncTransport) -> None:
         self._t = transport
 
-    async def status(self) -> Any:
-        """Get the system status."""
-        return await self._t._get("/api/v1/system/status")
+    status = _async_get_endpoint("/api/v1/system/status", "Get the system status.")
 
-    async def metrics(self) -> Any:
-        """Get system metrics."""
-        return await self._t._get("/api/v1/system/metrics")
+    metrics = _async_get_endpoint("/api/v1/system/metrics", "Get system metrics.")
 
 
+@final
 class AsyncCronNamespace:
     """Scheduled task (cron) endpoints (async)."""
 
+    __slots__ = ("_t",)
+
     def __init__(self, transport: AsyncTransport) -> None:
         self._t = transport
 
-    async def list(self) -> Any:
-        """List all cron jobs."""
-        return await self._t._get("/api/v1/cron")
+    list = _async_get_endpoint("/api/v1/cron", "List all cron jobs.")
 
     async def create(
         self,
@@ -679,21 +987,20 @@ class AsyncCronNamespace:
 
     async def update(self, cron_id: str, *, enabled: bool | None = None) -> Any:
         """Update a cron job."""
-        body: dict[str, Any] = {}
-        if enabled is not None:
-            body["enabled"] = enabled
+        body = _EMPTY_BODY if enabled is None else {"enabled": enabled}
         return await self._t._patch(f"/api/v1/cron/{cron_id}", json=body)
 
 
+@final
 class AsyncTriggersNamespace:
     """Event trigger endpoints (async)."""
 
+    __slots__ = ("_t",)
+
     def __init__(self, transport: AsyncTransport) -> None:
         self._t = transport
 
-    async def list(self) -> Any:
-        """List all triggers."""
-        return await self._t._get("/api/v1/triggers")
+    list = _async_get_endpoint("/api/v1/triggers", "List all triggers.")
 
     async def create(
         self,
@@ -713,9 +1020,12 @@ class AsyncTriggersNamespace:
         return await self._t._delete(f"/api/v1/triggers/{trigger_id}")
 
 
+@final
 class _AsyncOrgsMembersNamespace:
     """Organization member management (nested under orgs, async)."""
 
+    __slots__ = ("_t",)
+
     def __init__(self, transport: AsyncTransport) -> None:
         self._t = transport
 
@@ -725,9 +1035,7 @@ class _AsyncOrgsMembersNamespace:
 
     async def invite(self, org_id: str, *, user_id: str, role: str | None = None) -> Any:
         """Invite a user to an organization."""
-        body: dict[str, Any] = {"userId": user_id}
-        if role is not None:
-            body["role"] = role
+        body = _compact(("userId", user_id), ("role", role))
         return await self._t._post(f"/api/v1/orgs/{org_id}/members", json=body)
 
     async def remove(self, org_id: str, user_id: str) -> Any:
@@ -742,9 +1050,12 @@ class _AsyncOrgsMembersNamespace:
         )
 
 
+@final
 class _AsyncOrgsTeamsNamespace:
     """Organization team management (nested under orgs, async)."""
 
+    __slots__ = ("_t",)
+
     def __init__(self, transport: AsyncTransport) -> None:
         self._t = transport
 
@@ -756,9 +1067,7 @@ class _AsyncOrgsTeamsNamespace:
         self, org_id: str, *, name: str, description: str | None = None
     ) -> Any:
         """Create a team in an organization."""
-        body: dict[str, Any] = {"name": name}
-        if description is not None:
-            body["description"] = description
+        body = _compact(("name", name), ("description", description))
         return await self._t._post(f"/api/v1/orgs/{org_id}/teams", json=body)
 
     async def delete(self, org_id: str, team_id: str) -> Any:
@@ -774,9 +1083,7 @@ class _AsyncOrgsTeamsNamespace:
         role: str | None = None,
     ) -> Any:
         """Add a member to a team."""
-        body: dict[str, Any] = {"userId": user_id}
-        if role is not None:
-            body["role"] = role
+        body = _compact(("userId", user_id), ("role", role))
         return await self._t._post(
             f"/api/v1/orgs/{org_id}/teams/{team_id}/members",
             json=body,
@@ -789,24 +1096,29 @@ class _AsyncOrgsTeamsNamespace:
         )
 
 
-class AsyncOrgsNamespace:
+@final
+class AsyncOrgsNamespace(_LazySubNamespaces):
     """Organization and RBAC endpoints (async)."""
 
+    __slots__ = ("_t", "members", "teams")
+
+    _SUBNAMESPACES = {
+        "members": _AsyncOrgsMembersNamespace,
+        "teams": _AsyncOrgsTeamsNamespace,
+    }
+
+    members: _AsyncOrgsMembersNamespace
+    teams: _AsyncOrgsTeamsNamespace
+
     def __init__(self, transport: AsyncTransport) -> None:
         self._t = transport
-        self.members = _AsyncOrgsMembersNamespace(transport)
-        self.teams = _AsyncOrgsTeamsNamespace(transport)
 
     async def create(self, *, name: str, display_name: str | None = None) -> Any:
         """Create a new organization."""
-        body: dict[str, Any] = {"name": name}
-        if display_name is not None:
-            body["displayName"] = display_name
+        body = _compact(("name", name), ("displayName", display_name))
         return await self._t._post("/api/v1/orgs", json=body)
 
-    async def list(self) -> Any:
-        """List all organizations."""
-        return await self._t._get("/api/v1/orgs")
+    list = _async_get_endpoint("/api/v1/orgs", "List all organizations.")
 
     async def get(self, org_id: str) -> Any:
         """Get organization details."""
@@ -824,17 +1136,19 @@ class AsyncOrgsNamespace:
         settings: dict[str, Any] | None = None,
     ) -> Any:
         """Update an organization."""
-        body: dict[str, Any] = {}
-        if display_name is not None:
-            body["displayName"] = display_name
-        if settings is not None:
-            body["settings"] = settings
+        if display_name is None and settings is None:
+            body = _EMPTY_BODY
+        else:
+            body = _compact(("displayName", display_name), ("settings", settings))
         return await self._t._patch(f"/api/v1/orgs/{org_id}", json=body)
 
 
+@final
 class _AsyncMarketplaceTemplatesNamespace:
     """Marketplace template operations (nested under marketplace, async)."""
 
+    __slots__ = ("_t",)
+
     def __init__(self, transport: AsyncTransport) -> None:
         self._t = transport
 
@@ -842,15 +1156,27 @@ class _AsyncMarketplaceTemplatesNamespace:
         self,
         *,
         category: str | None = None,
-        tags: list[str] | None = None,
+        tags: str | Sequence[str] | None = None,
+        cache: bool = False,
+        no_cache: bool = False,
     ) -> Any:
-        """List marketplace templates."""
-        params: dict[str, Any] = {}
-        if category is not None:
-            params["category"] = category
-        if tags is not None:
-            params["tags"] = ",".join(tags)
-        return await self._t._get("/api/v1/marketplace/templates", params=params)
+        """List marketplace templates.
+
+        ``tags`` may be a sequence of tags or an already comma-joined
+        string, which is sent as-is; callers filtering on the same tags
+        repeatedly can join them once. Pass ``cache=True`` to reuse a
+        response younger than the client's ``cache_ttl`` instead of sending
+        a request, or ``no_cache=True`` to bypass every cache.
+        """
+        if tags is not None and not isinstance(tags, str):
+            tags = ",".join(tags)
+        return await self._t._get(
+            _with_query(
+                "/api/v1/marketplace/templates", ("category", category), ("tags", tags)
+            ),
+            cache=cache,
+            no_cache=no_cache,
+        )
 
     async def publish(self, template: Any) -> Any:
         """Publish a template to the marketplace."""
@@ -864,9 +1190,7 @@ class _AsyncMarketplaceTemplatesNamespace:
         self, template_id: str, *, rating: int, review: str | None = None
     ) -> Any:
         """Rate a marketplace template."""
-        body: dict[str, Any] = {"rating": rating}
-        if review is not None:
-            body["review"] = review
+        body = _compact(("rating", rating), ("review", review))
         return await self._t._post(
             f"/api/v1/marketplace/templates/{template_id}/rate",
             json=body,
@@ -879,23 +1203,30 @@ class _AsyncMarketplaceTemplatesNamespace:
         )
 
 
-class AsyncMarketplaceNamespace:
+@final
+class AsyncMarketplaceNamespace(_LazySubNamespaces):
     """Marketplace endpoints (async)."""
 
+    __slots__ = ("_t", "templates")
+
+    _SUBNAMESPACES = {"templates": _AsyncMarketplaceTemplatesNamespace}
+
+    templates: _AsyncMarketplaceTemplatesNamespace
+
     def __init__(self, transport: AsyncTransport) -> None:
         self._t = transport
-        self.templates = _AsyncMarketplaceTemplatesNamespace(transport)
 
 
+@final
 class AsyncIntegrationsNamespace:
     """Third-party integration endpoints (async)."""
 
+    __slots__ = ("_t",)
+
     def __init__(self, transport: AsyncTransport) -> None:
         self._t = transport
 
-    async def list(self) -> Any:
-        """List all integrations."""
-        return await self._t._get("/api/v1/integrations")
+    list = _async_get_endpoint("/api/v1/integrations", "List all integrations.")
 
     async def get(self, integration_id: str) -> Any:
         """Get integration details."""
@@ -909,9 +1240,7 @@ class AsyncIntegrationsNamespace:
         credentials: dict[str, str] | None = None,
     ) -> Any:
         """Register a new integration."""
-        body: dict[str, Any] = {"type": type, "name": name}
-        if credentials is not None:
-            body["credentials"] = credentials
+        body = _compact(("type", type), ("name", name), ("credentials", credentials))
         return await self._t._post("/api/v1/integrations", json=body)
 
     async def unregister(self, integration_id: str) -> Any:
@@ -930,60 +1259,119 @@ class AsyncIntegrationsNamespace:
         params: dict[str, Any] | None = None,
     ) -> Any:
         """Execute an action on an integration."""
-        body: dict[str, Any] = {"action": action}
-        if params is not None:
-            body["params"] = params
+        body = _compact(("action", action), ("params", params))
         return await self._t._post(
             f"/api/v1/integrations/{integration_id}/execute",
             json=body,
         )
 
+    async def execute_many(
+        self,
+        integration_id: str,
+        calls: Iterable[dict[str, Any]],
+        *,
+        max_concurrency: int | None = None,
+    ) -> builtins.list[Any]:
+        """Execute several actions concurrently, in ``calls`` order.
+
+        Each item holds the keyword arguments of :meth:`execute`, e.g.
+        ``{"action": "send", "params": {...}}``. ``max_concurrency``
+        overrides the client's limit on requests in flight.
+        """
+        return await self._t.gather(
+            *(self.execute(integration_id, **call) for call in calls),
+            max_concurrency=max_concurrency,
+        )
+
 
+@final
 class AsyncWebhooksNamespace:
     """Webhook endpoints (async)."""
 
+    __slots__ = ("_t",)
+
     def __init__(self, transport: AsyncTransport) -> None:
         self._t = transport
 
-    async def list(self) -> Any:
-        """List all webhooks."""
-        return await self._t._get("/api/v1/webhooks")
+    list = _async_get_endpoint("/api/v1/webhooks", "List all webhooks.")
 
     async def create(
         self,
         *,
         url: str,
-        events: list[str],
+        events: builtins.list[str],
         secret: str | None = None,
     ) -> Any:
         """Create a new webhook."""
-        body: dict[str, Any] = {"url": url, "events": events}
-        if secret is not None:
-            body["secret"] = secret
+        body = _compact(("url", url), ("events", events), ("secret", secret))
         return await self._t._post("/api/v1/webhooks", json=body)
 
+    async def create_many(
+        self,
+        specs: Iterable[dict[str, Any]],
+        *,
+        max_concurrency: int | None = None,
+    ) -> builtins.list[Any]:
+        """Create several webhooks concurrently, in ``specs`` order.
+
+        Each spec holds the keyword arguments of :meth:`create`. The server
+        has no bulk endpoint, so one request is sent per webhook; lower
+        ``max_concurrency`` if the server struggles with the burst.
+        """
+        return await self._t.gather(
+            *(self.create(**spec) for spec in specs),
+            max_concurrency=max_concurrency,
+        )
+
     async def delete(self, webhook_id: str) -> Any:
         """Delete a webhook."""
         return await self._t._delete(f"/api/v1/webhooks/{webhook_id}")
 
 
+@final
 class AsyncPluginsNamespace:
     """Plugin marketplace endpoints (async)."""
 
+    __slots__ = ("_t",)
+
     def __init__(self, transport: AsyncTransport) -> None:
         self._t = transport
 
-    async def list(self, *, category: str | None = None) -> Any:
-        """List available plugins."""
-        params: dict[str, Any] = {}
-        if category is not None:
-            params["category"] = category
-        return await self._t._get("/api/v1/marketplace/plugins", params=params)
+    async def list(
+        self,
+        *,
+        category: str | None = None,
+        cache: bool = False,
+        no_cache: bool = False,
+    ) -> Any:
+        """List available plugins.
+
+        Pass ``cache=True`` to reuse a response younger than the client's
+        ``cache_ttl`` instead of sending a request, or ``no_cache=True`` to
+        bypass every cache and fetch a fresh copy.
+        """
+        return await self._t._get(
+            _with_query("/api/v1/marketplace/plugins", ("category", category)),
+            cache=cache,
+            no_cache=no_cache,
+        )
 
     async def install(self, manifest: Any) -> Any:
         """Install a plugin from a manifest."""
         return await self._t._post("/api/v1/marketplace/plugins", json=manifest)
 
+    async def install_many(
+        self,
+        manifests: Iterable[Any],
+        *,
+        max_concurrency: int | None = None,
+    ) -> builtins.list[Any]:
+        """Install several plugins concurrently, in ``manifests`` order."""
+        return await self._t.gather(
+            *(self.install(manifest) for manifest in manifests),
+            max_concurrency=max_concurrency,
+        )
+
     async def uninstall(self, plugin_id: str) -> Any:
         """Uninstall a plugin."""
         return await self._t._delete(f"/api/v1/marketplace/plugins/{plugin_id}")
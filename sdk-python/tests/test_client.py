@@ -5,13 +5,24 @@ Uses ``respx`` to mock httpx requests without hitting a real server.
 
 from __future__ import annotations
 
+import asyncio
+import importlib
+import importlib.util
 import json
+import sys
+import types
+import weakref
+from typing import AsyncIterator, Iterator
+from unittest import mock
 
 import httpx
 import pytest
 import respx
 
+import aether
 from aether import AetherClient, AetherAsyncClient, AetherError
+from aether.events import _batch_events, _FrameParser, subscribe_events
+from aether.namespaces import _encode_query, _with_query
 
 
 # ---------------------------------------------------------------------------
@@ -21,10 +32,22 @@ from aether import AetherClient, AetherAsyncClient, AetherError
 BASE_URL = "http://aether.test"
 
 
+@pytest.fixture(scope="module")
+def _shared_client() -> Iterator[AetherClient]:
+    """Build one sync client per module; constructing its transport is slow."""
+    with AetherClient(BASE_URL, token="test-token-123") as c:
+        yield c
+
+
 @pytest.fixture()
-def client() -> AetherClient:
-    """Create a sync AetherClient pointed at the test base URL."""
-    return AetherClient(BASE_URL, token="test-token-123")
+def client(_shared_client: AetherClient) -> Iterator[AetherClient]:
+    """Provide the shared sync AetherClient pointed at the test base URL.
+
+    Restoring the token afterwards also clears the client's response
+    caches, so no state leaks from one test into the next.
+    """
+    yield _shared_client
+    _shared_client.set_token("test-token-123")
 
 
 @pytest.fixture()
@@ -77,6 +100,128 @@ class TestClientConstruction:
         assert hasattr(c, "webhooks")
         assert hasattr(c, "plugins")
 
+    def test_namespaces_created_once_on_access(self) -> None:
+        c = AetherClient(BASE_URL)
+        assert c.agents is c.agents
+        assert c.events is c.events
+        with pytest.raises(AttributeError):
+            c.not_a_namespace
+        assert c.orgs.members is c.orgs.members
+        with pytest.raises(AttributeError):
+            c.orgs.not_a_namespace
+
+    def test_connect_timeout_is_separate(self) -> None:
+        with AetherClient(BASE_URL, timeout=60.0, connect_timeout=2.0) as c:
+            assert c._http.timeout == httpx.Timeout(60.0, connect=2.0)
+
+    def test_env_var_installs_uvloop(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        policy = object()
+        installed: list[object] = []
+        fake = types.SimpleNamespace(EventLoopPolicy=lambda: policy)
+        monkeypatch.setitem(sys.modules, "uvloop", fake)
+        monkeypatch.setitem(sys.modules, "winloop", fake)
+        monkeypatch.setattr(asyncio, "set_event_loop_policy", installed.append)
+        monkeypatch.setenv("AETHER_USE_UVLOOP", "1")
+
+        importlib.reload(aether)
+
+        assert installed == [policy]
+
+    def test_http2_defaults_to_h2_availability(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        from aether.client import _resolve_http2
+
+        monkeypatch.setattr(importlib.util, "find_spec", lambda name: None)
+        assert _resolve_http2(None) is False
+        assert _resolve_http2(True) is True
+        monkeypatch.setattr(importlib.util, "find_spec", lambda name: object())
+        assert _resolve_http2(None) is True
+        assert _resolve_http2(False) is False
+
+    def test_environment_proxy_is_mounted(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        for name in ("ALL_PROXY", "HTTP_PROXY", "NO_PROXY"):
+            monkeypatch.delenv(name, raising=False)
+            monkeypatch.delenv(name.lower(), raising=False)
+        monkeypatch.setenv("HTTPS_PROXY", "http://proxy.test:3128")
+
+        with AetherClient("https://aether.test") as c:
+            sync_mounts = {p.pattern: t for p, t in c._http._mounts.items()}
+        async_mounts = {
+            p.pattern: t
+            for p, t in AetherAsyncClient("https://aether.test")._http._mounts.items()
+        }
+
+        for mounts in (sync_mounts, async_mounts):
+            assert list(mounts) == ["https://"]
+            proxy_pool = mounts["https://"]._pool  # type: ignore[union-attr]
+            assert proxy_pool._proxy_url.host == b"proxy.test"
+
+    def test_no_proxy_hosts_bypass_the_proxy(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        for name in ("ALL_PROXY", "HTTPS_PROXY"):
+            monkeypatch.delenv(name, raising=False)
+            monkeypatch.delenv(name.lower(), raising=False)
+        monkeypatch.setenv("HTTP_PROXY", "proxy.test:3128")
+        monkeypatch.setenv("NO_PROXY", "localhost, 10.0.0.1,::1,.internal.test")
+
+        with AetherClient(BASE_URL) as c:
+            mounts = {p.pattern: t for p, t in c._http._mounts.items()}
+
+        assert mounts.pop("http://") is not None
+        assert mounts == {
+            "all://*localhost": None,
+            "all://10.0.0.1": None,
+            "all://[::1]": None,
+            "all://*.internal.test": None,
+        }
+        monkeypatch.setenv("NO_PROXY", "*")
+        with AetherClient(BASE_URL) as c:
+            assert not c._http._mounts
+
+    def test_clients_share_ssl_context(self) -> None:
+        with AetherClient(BASE_URL) as a, AetherClient("https://other.test") as b:
+            pool_a = a._http._transport._pool  # type: ignore[attr-defined]
+            pool_b = b._http._transport._pool  # type: ignore[attr-defined]
+            assert pool_a._ssl_context is pool_b._ssl_context
+
+    @respx.mock
+    def test_prefetch_catalog_builds_namespaces(self) -> None:
+        paths = (
+            "templates",
+            "marketplace/templates",
+            "marketplace/plugins",
+            "integrations",
+        )
+        for path in paths:
+            respx.get(f"{BASE_URL}/api/v1/{path}").mock(
+                return_value=httpx.Response(200, json={"data": [path]})
+            )
+
+        with AetherClient(BASE_URL) as c:
+            catalog = c.prefetch_catalog()
+
+        assert catalog["marketplace_templates"] == ["marketplace/templates"]
+        assert catalog["integrations"] == ["integrations"]
+
+    def test_accessors_are_slotted(self) -> None:
+        c = AetherClient(BASE_URL)
+        assert not hasattr(c.events, "__dict__")
+        assert not hasattr(c.agents, "__dict__")
+        assert not hasattr(c.orgs.teams, "__dict__")
+
+    @pytest.mark.parametrize("cls", [AetherClient, AetherAsyncClient])
+    def test_clients_support_weakrefs_and_patching(self, cls: type) -> None:
+        c = cls(BASE_URL)
+        with mock.patch.object(c, "_get", mock.Mock(return_value="patched")):
+            assert c._get("/api/v1/agents") == "patched"
+        c.custom = 1
+        assert c.custom == 1
+        assert weakref.ref(c)() is c
+
     def test_context_manager(self) -> None:
         with AetherClient(BASE_URL) as c:
             assert c._token is None
@@ -160,6 +305,50 @@ class TestAgentsNamespace:
         assert "limit=10" in str(request.url)
         assert "offset=5" in str(request.url)
 
+    @respx.mock
+    def test_agents_list_as_struct(self, client: AetherClient) -> None:
+        models = pytest.importorskip("aether.models")
+        respx.get(f"{BASE_URL}/api/v1/agents").mock(
+            return_value=httpx.Response(
+                200,
+                json={
+                    "data": [{"uid": "a1", "pid": 7, "agentPhase": "thinking"}],
+                    "meta": {"total": 1},
+                },
+            )
+        )
+
+        result = client.agents.list(as_struct=True)
+
+        assert result == [models.Agent(uid="a1", pid=7, agent_phase="thinking")]
+
+    @respx.mock
+    @pytest.mark.parametrize(
+        "body", [b'{"data": [{"pid": 7}]}', b'{"data": [', b'{"data": "x"}']
+    )
+    def test_agents_list_as_struct_bad_body(
+        self, client: AetherClient, body: bytes
+    ) -> None:
+        pytest.importorskip("aether.models")
+        respx.get(f"{BASE_URL}/api/v1/agents").mock(
+            return_value=httpx.Response(200, content=body)
+        )
+
+        with pytest.raises(AetherError) as exc_info:
+            client.agents.list(as_struct=True)
+
+        assert exc_info.value.code == "INVALID_RESPONSE"
+        assert exc_info.value.status == 200
+
+    @respx.mock
+    def test_agents_list_as_struct_no_content(self, client: AetherClient) -> None:
+        pytest.importorskip("aether.models")
+        respx.get(f"{BASE_URL}/api/v1/agents").mock(
+            return_value=httpx.Response(204)
+        )
+
+        assert client.agents.list(as_struct=True) is None
+
     @respx.mock
     def test_agents_spawn(self, client: AetherClient) -> None:
         route = respx.post(f"{BASE_URL}/api/v1/agents").mock(
@@ -177,6 +366,23 @@ class TestAgentsNamespace:
         assert body["goal"] == "analyze data"
         assert result["uid"] == "new-agent"
 
+    @respx.mock
+    def test_request_body_is_compact_json(self, client: AetherClient) -> None:
+        route = respx.post(f"{BASE_URL}/api/v1/agents").mock(
+            return_value=httpx.Response(201, json={"data": {}})
+        )
+
+        client.agents.spawn(role="analyst", goal="naïve", tools=["fs"])
+
+        request = route.calls.last.request
+        assert request.headers["Content-Type"] == "application/json"
+        assert json.loads(request.content) == {
+            "role": "analyst",
+            "goal": "naïve",
+            "tools": ["fs"],
+        }
+        assert b" " not in request.content
+
     @respx.mock
     def test_agents_get(self, client: AetherClient) -> None:
         respx.get(f"{BASE_URL}/api/v1/agents/agent-123").mock(
@@ -199,6 +405,27 @@ class TestAgentsNamespace:
         assert route.called
         assert result["killed"] is True
 
+    @respx.mock
+    def test_bodiless_requests_omit_content_type(self, client: AetherClient) -> None:
+        get = respx.get(f"{BASE_URL}/api/v1/agents/a1").mock(
+            return_value=httpx.Response(200, json={"data": {}})
+        )
+        delete = respx.delete(f"{BASE_URL}/api/v1/agents/a1").mock(
+            return_value=httpx.Response(200, json={"data": {}})
+        )
+        events = respx.get(f"{BASE_URL}/api/v1/events").mock(
+            return_value=httpx.Response(
+                200, text="", headers={"Content-Type": "text/event-stream"}
+            )
+        )
+
+        client.agents.get("a1")
+        client.agents.kill("a1")
+        list(client.events.subscribe())
+
+        for route in (get, delete, events):
+            assert "Content-Type" not in route.calls.last.request.headers
+
     @respx.mock
     def test_agents_message(self, client: AetherClient) -> None:
         route = respx.post(f"{BASE_URL}/api/v1/agents/a1/message").mock(
@@ -210,6 +437,19 @@ class TestAgentsNamespace:
         assert body == {"content": "hello agent"}
         assert result["id"] == "m1"
 
+    @respx.mock
+    def test_agents_message_raw_sends_bytes_verbatim(self, client: AetherClient) -> None:
+        route = respx.post(f"{BASE_URL}/api/v1/agents/a1/message").mock(
+            return_value=httpx.Response(200, json={"data": {"id": "m1"}})
+        )
+        body = b'{"content":"hello agent"}'
+
+        client.agents.message_raw("a1", body)
+        client.agents.message_raw("a1", body)
+
+        assert [c.request.content for c in route.calls] == [body, body]
+        assert route.calls.last.request.headers["Content-Type"] == "application/json"
+
     @respx.mock
     def test_agents_timeline(self, client: AetherClient) -> None:
         respx.get(f"{BASE_URL}/api/v1/agents/a1/timeline").mock(
@@ -246,6 +486,20 @@ class TestAgentsNamespace:
         result = client.agents.profile("a1")
         assert result["role"] == "coder"
 
+    @respx.mock
+    def test_iter_list_pages_until_short_page(self, client: AetherClient) -> None:
+        route = respx.get(f"{BASE_URL}/api/v1/agents").mock(
+            side_effect=[
+                httpx.Response(200, json={"data": [{"uid": "a1"}, {"uid": "a2"}]}),
+                httpx.Response(200, json={"data": [{"uid": "a3"}]}),
+            ]
+        )
+
+        uids = [agent["uid"] for agent in client.agents.iter_list(page_size=2)]
+
+        assert uids == ["a1", "a2", "a3"]
+        assert route.calls[1].request.url.params["offset"] == "2"
+
 
 # ---------------------------------------------------------------------------
 # Error handling
@@ -285,6 +539,29 @@ class TestErrorHandling:
         assert err.status == 500
         assert err.code == "HTTP_500"
 
+    @respx.mock
+    def test_empty_error_body_falls_back_to_status(self, client: AetherClient) -> None:
+        respx.get(f"{BASE_URL}/api/v1/system/status").mock(
+            return_value=httpx.Response(502)
+        )
+
+        with pytest.raises(AetherError) as exc_info:
+            client.system.status()
+
+        assert exc_info.value.message == "HTTP 502: Bad Gateway"
+
+    @respx.mock
+    def test_non_object_error_falls_back_to_status(self, client: AetherClient) -> None:
+        respx.get(f"{BASE_URL}/api/v1/agents").mock(
+            return_value=httpx.Response(400, json={"error": "bad request"})
+        )
+
+        with pytest.raises(AetherError) as exc_info:
+            client.agents.list()
+
+        assert exc_info.value.code == "HTTP_400"
+        assert exc_info.value.message == "HTTP 400: Bad Request"
+
     @respx.mock
     def test_401_unauthorized(self, client: AetherClient) -> None:
         respx.get(f"{BASE_URL}/api/v1/agents").mock(
@@ -365,6 +642,15 @@ class TestFSNamespace:
         result = client.fs.read("folder/file.txt")
         assert result["content"] == "data"
 
+    @respx.mock
+    def test_fs_url_encodes_spaces_and_unicode(self, client: AetherClient) -> None:
+        route = respx.get(f"{BASE_URL}/api/v1/fs/my%20docs%2F%C3%BC%2Bx.txt").mock(
+            return_value=httpx.Response(200, json={"data": {"content": "data"}})
+        )
+
+        client.fs.read("my docs/ü+x.txt")
+        assert route.called
+
 
 class TestSystemNamespace:
     """Verify system namespace endpoints."""
@@ -539,6 +825,53 @@ class TestPluginsNamespace:
         assert body["name"] == "cool-plugin"
         assert result["id"] == "p2"
 
+    @respx.mock
+    def test_plugins_list_query_is_memoized(self, client: AetherClient) -> None:
+        route = respx.get(f"{BASE_URL}/api/v1/marketplace/plugins").mock(
+            return_value=httpx.Response(200, json={"data": []})
+        )
+
+        hits = _encode_query.cache_info().hits
+        client.plugins.list(category="dev tools")
+        client.plugins.list(category="dev tools")
+
+        assert [c.request.url.params["category"] for c in route.calls] == [
+            "dev tools"
+        ] * 2
+        assert _encode_query.cache_info().hits == hits + 1
+
+    def test_query_encoding_matches_httpx_params(self) -> None:
+        pairs = (("query", "a b&c/é"), ("limit", True), ("offset", None))
+
+        url = _with_query("/api/v1/agents/a1/memory", *pairs)
+
+        expected = httpx.Request(
+            "GET",
+            f"{BASE_URL}/api/v1/agents/a1/memory",
+            params={"query": "a b&c/é", "limit": True},
+        ).url
+        assert httpx.URL(BASE_URL + url) == expected
+        assert _with_query("/x", ("limit", True)) == "/x?limit=true"
+        assert _with_query("/x", ("limit", 1)) == "/x?limit=1"
+
+
+class TestPreparedRequests:
+    """Verify prepare()/send() reuse a built request."""
+
+    @respx.mock
+    def test_prepared_request_can_be_resent(self, client: AetherClient) -> None:
+        route = respx.get(f"{BASE_URL}/api/v1/system/status").mock(
+            return_value=httpx.Response(200, json={"data": {"healthy": True}})
+        )
+
+        request = client.prepare("GET", "/api/v1/system/status")
+        first = client.send(request)
+        second = client.send(request)
+
+        assert first == second == {"healthy": True}
+        assert route.call_count == 2
+        assert route.calls.last.request.headers["Authorization"] == "Bearer test-token-123"
+
 
 # ---------------------------------------------------------------------------
 # Authorization header
@@ -571,6 +904,29 @@ class TestAuthorizationHeader:
         request = route.calls.last.request
         assert "Authorization" not in request.headers
 
+    @respx.mock
+    def test_set_token_updates_header(self, client: AetherClient) -> None:
+        route = respx.get(f"{BASE_URL}/api/v1/agents").mock(
+            return_value=httpx.Response(200, json={"data": []})
+        )
+
+        client.set_token("rotated-token")
+        client.agents.list()
+
+        request = route.calls.last.request
+        assert request.headers["Authorization"] == "Bearer rotated-token"
+
+    @respx.mock
+    def test_set_token_none_clears_header(self, client: AetherClient) -> None:
+        route = respx.get(f"{BASE_URL}/api/v1/agents").mock(
+            return_value=httpx.Response(200, json={"data": []})
+        )
+
+        client.set_token(None)
+        client.agents.list()
+
+        assert "Authorization" not in route.calls.last.request.headers
+
 
 # ---------------------------------------------------------------------------
 # Response unwrapping
@@ -598,6 +954,57 @@ class TestResponseUnwrapping:
         result = client.login("u", "p")
         assert result["token"] == "abc"
 
+    @respx.mock
+    def test_no_content_returns_none(self, client: AetherClient) -> None:
+        respx.delete(f"{BASE_URL}/api/v1/webhooks/wh1").mock(
+            return_value=httpx.Response(204)
+        )
+
+        assert client.webhooks.delete("wh1") is None
+
+    @respx.mock
+    def test_etag_cache_serves_not_modified(self) -> None:
+        route = respx.get(f"{BASE_URL}/api/v1/system/status").mock(
+            side_effect=[
+                httpx.Response(200, json={"data": {"ok": True}}, headers={"ETag": '"v1"'}),
+                httpx.Response(304),
+            ]
+        )
+
+        with AetherClient(BASE_URL, token="t", etag_cache_size=8) as c:
+            assert c.system.status() == {"ok": True}
+            assert c.system.status() == {"ok": True}
+
+        assert "If-None-Match" not in route.calls[0].request.headers
+        assert route.calls[1].request.headers["If-None-Match"] == '"v1"'
+
+    @respx.mock
+    def test_ttl_cache_reuses_response(self, client: AetherClient) -> None:
+        route = respx.get(f"{BASE_URL}/api/v1/marketplace/plugins").mock(
+            return_value=httpx.Response(200, json={"data": [{"id": "p1"}]})
+        )
+
+        first = client.plugins.list(category="tools", cache=True)
+        second = client.plugins.list(category="tools", cache=True)
+        client.plugins.list(category="tools")
+
+        assert first == second == [{"id": "p1"}]
+        assert route.call_count == 2
+
+    @respx.mock
+    def test_no_cache_bypasses_etag_cache(self) -> None:
+        route = respx.get(f"{BASE_URL}/api/v1/webhooks").mock(
+            return_value=httpx.Response(200, json={"data": []}, headers={"ETag": '"v1"'})
+        )
+
+        with AetherClient(BASE_URL, etag_cache_size=8) as c:
+            c.webhooks.list()
+            c.webhooks.list(no_cache=True)
+
+        request = route.calls.last.request
+        assert "If-None-Match" not in request.headers
+        assert request.headers["Cache-Control"] == "no-cache"
+
 
 # ---------------------------------------------------------------------------
 # Async client — basic smoke tests
@@ -630,6 +1037,15 @@ class TestAsyncClient:
         assert async_client._token == "async-tok"
         assert result["user"]["id"] == "u1"
 
+    def test_async_namespaces_are_slotted(
+        self, async_client: AetherAsyncClient
+    ) -> None:
+        for name in ("agents", "fs", "templates", "system", "cron", "triggers"):
+            assert not hasattr(getattr(async_client, name), "__dict__"), name
+        for name in ("orgs", "marketplace", "integrations", "webhooks", "plugins"):
+            assert not hasattr(getattr(async_client, name), "__dict__"), name
+        assert not hasattr(async_client.marketplace.templates, "__dict__")
+
     @respx.mock
     @pytest.mark.asyncio
     async def test_async_error_handling(self, async_client: AetherAsyncClient) -> None:
@@ -659,6 +1075,245 @@ class TestAsyncClient:
 
         assert c._http.is_closed
 
+    def test_unknown_transport_rejected(self) -> None:
+        with pytest.raises(ValueError):
+            AetherAsyncClient(BASE_URL, transport="carrier-pigeon")
+
+    @pytest.mark.asyncio
+    async def test_max_concurrency_below_one_rejected(
+        self, async_client: AetherAsyncClient
+    ) -> None:
+        with pytest.raises(ValueError):
+            AetherAsyncClient(BASE_URL, max_concurrency=0)
+        with pytest.raises(ValueError):
+            await async_client.gather(async_client.system.status(), max_concurrency=0)
+
+    def test_aiohttp_transport_rejects_http2(self) -> None:
+        with pytest.raises(ValueError):
+            AetherAsyncClient(BASE_URL, transport="aiohttp", http2=True)
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_async_gather(self, async_client: AetherAsyncClient) -> None:
+        respx.get(f"{BASE_URL}/api/v1/agents").mock(
+            return_value=httpx.Response(200, json={"data": [{"uid": "a1"}]})
+        )
+        respx.get(f"{BASE_URL}/api/v1/system/status").mock(
+            return_value=httpx.Response(500, text="boom")
+        )
+
+        agents, status = await async_client.gather(
+            async_client.agents.list(),
+            async_client.system.status(),
+            return_exceptions=True,
+        )
+
+        assert agents == [{"uid": "a1"}]
+        assert isinstance(status, AetherError)
+        assert status.status == 500
+
+    @pytest.mark.asyncio
+    async def test_async_gather_bounds_concurrency(
+        self, async_client: AetherAsyncClient
+    ) -> None:
+        running = peak = 0
+
+        async def call(n: int) -> int:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0)
+            running -= 1
+            return n
+
+        results = await async_client.gather(
+            *(call(n) for n in range(6)), max_concurrency=2
+        )
+
+        assert results == list(range(6))
+        assert peak == 2
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_async_agents_get_many(self, async_client: AetherAsyncClient) -> None:
+        respx.get(url__regex=rf"{BASE_URL}/api/v1/agents/(?P<uid>\w+)$").mock(
+            side_effect=lambda request, uid: httpx.Response(200, json={"uid": uid})
+        )
+
+        result = await async_client.agents.get_many(["a1", "a2", "a3"])
+
+        assert [agent["uid"] for agent in result] == ["a1", "a2", "a3"]
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_async_coalesces_concurrent_gets(self) -> None:
+        route = respx.get(f"{BASE_URL}/api/v1/system/status").mock(
+            return_value=httpx.Response(200, json={"data": {"ok": True}})
+        )
+
+        async with AetherAsyncClient(BASE_URL, coalesce_gets=True) as c:
+            first, second = await asyncio.gather(c.system.status(), c.system.status())
+            third = await c.system.status()
+
+        assert first is second
+        assert third == {"ok": True}
+        assert route.call_count == 2
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_async_webhooks_create_many(
+        self, async_client: AetherAsyncClient
+    ) -> None:
+        route = respx.post(f"{BASE_URL}/api/v1/webhooks").mock(
+            side_effect=lambda request: httpx.Response(
+                201, json={"data": json.loads(request.content)}
+            )
+        )
+        specs = [
+            {"url": f"https://hooks.test/{n}", "events": ["agent.spawned"]}
+            for n in range(3)
+        ]
+
+        result = await async_client.webhooks.create_many(specs, max_concurrency=1)
+
+        assert result == specs
+        assert route.call_count == 3
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_async_batch(self, async_client: AetherAsyncClient) -> None:
+        route = respx.post(f"{BASE_URL}/api/v1/webhooks").mock(
+            side_effect=lambda request: httpx.Response(
+                201, json={"data": json.loads(request.content)}
+            )
+        )
+        respx.delete(f"{BASE_URL}/api/v1/plugins/p1").mock(
+            return_value=httpx.Response(204)
+        )
+
+        results = await async_client.batch(
+            [
+                ("POST", "/api/v1/webhooks", {"url": "https://a"}),
+                ("DELETE", "/api/v1/plugins/p1", None),
+                ("POST", "/api/v1/webhooks", {"url": "https://b"}),
+            ]
+        )
+
+        assert results == [{"url": "https://a"}, None, {"url": "https://b"}]
+        assert route.call_count == 2
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_prefetch_catalog(self, async_client: AetherAsyncClient) -> None:
+        paths = ("templates", "marketplace/templates", "marketplace/plugins", "integrations")
+        for path in paths:
+            respx.get(f"{BASE_URL}/api/v1/{path}").mock(
+                return_value=httpx.Response(200, json={"data": [path]})
+            )
+
+        catalog = await async_client.prefetch_catalog()
+
+        assert catalog == {
+            "templates": ["templates"],
+            "marketplace_templates": ["marketplace/templates"],
+            "plugins": ["marketplace/plugins"],
+            "integrations": ["integrations"],
+        }
+
+
+# ---------------------------------------------------------------------------
+# aiohttp transport
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture()
+async def aiohttp_base_url() -> AsyncIterator[str]:
+    """Serve a small fake Aether API over real sockets with aiohttp."""
+    web = pytest.importorskip("aiohttp.web")
+    test_utils = pytest.importorskip("aiohttp.test_utils")
+
+    async def status(request):
+        auth = request.headers.get("Authorization")
+        return web.json_response({"data": {"auth": auth}})
+
+    async def spawn(request):
+        return web.json_response({"data": await request.json()}, status=201)
+
+    async def agent(request):
+        if request.match_info["uid"] == "missing":
+            error = {"code": "AGENT_NOT_FOUND", "message": "No such agent"}
+            return web.json_response({"error": error}, status=404)
+        return web.json_response({"data": {"uid": request.match_info["uid"]}})
+
+    async def kill(request):
+        return web.Response(status=204)
+
+    async def slow(request):
+        await asyncio.sleep(1)
+        return web.json_response({"data": {}})
+
+    async def events(request):
+        response = web.StreamResponse(
+            headers={"Content-Type": "text/event-stream"}
+        )
+        await response.prepare(request)
+        for n in range(2):
+            await response.write(f'data: {{"n": {n}}}\n\n'.encode())
+        return response
+
+    app = web.Application()
+    app.router.add_get("/api/v1/system/status", status)
+    app.router.add_get("/api/v1/system/metrics", slow)
+    app.router.add_post("/api/v1/agents", spawn)
+    app.router.add_get("/api/v1/agents/{uid}", agent)
+    app.router.add_delete("/api/v1/agents/{uid}", kill)
+    app.router.add_get("/api/v1/events", events)
+    async with test_utils.TestServer(app) as server:
+        yield str(server.make_url(""))
+
+
+class TestAiohttpTransport:
+    """Send real requests through the aiohttp-backed transport."""
+
+    @pytest.mark.asyncio
+    async def test_requests_round_trip(self, aiohttp_base_url: str) -> None:
+        async with AetherAsyncClient(
+            aiohttp_base_url, token="t", transport="aiohttp"
+        ) as c:
+            status = await c.system.status()
+            spawned = await c.agents.spawn(role="coder", goal="ship")
+            killed = await c.agents.kill("a1")
+            agents = await c.agents.get_many(["a1", "a2"])
+
+        assert status == {"auth": "Bearer t"}
+        assert spawned == {"role": "coder", "goal": "ship"}
+        assert killed is None
+        assert agents == [{"uid": "a1"}, {"uid": "a2"}]
+
+    @pytest.mark.asyncio
+    async def test_error_response_raises(self, aiohttp_base_url: str) -> None:
+        async with AetherAsyncClient(aiohttp_base_url, transport="aiohttp") as c:
+            with pytest.raises(AetherError) as exc_info:
+                await c.agents.get("missing")
+
+        assert exc_info.value.status == 404
+        assert exc_info.value.code == "AGENT_NOT_FOUND"
+
+    @pytest.mark.asyncio
+    async def test_event_stream(self, aiohttp_base_url: str) -> None:
+        async with AetherAsyncClient(aiohttp_base_url, transport="aiohttp") as c:
+            events = [event async for event in c.events.subscribe()]
+
+        assert events == [{"n": 0}, {"n": 1}]
+
+    @pytest.mark.asyncio
+    async def test_slow_response_is_read_timeout(self, aiohttp_base_url: str) -> None:
+        async with AetherAsyncClient(
+            aiohttp_base_url, transport="aiohttp", timeout=0.1
+        ) as c:
+            with pytest.raises(httpx.ReadTimeout):
+                await c.system.metrics()
+
 
 # ---------------------------------------------------------------------------
 # SSE event parsing
@@ -668,32 +1323,21 @@ class TestAsyncClient:
 class TestSSEEventParsing:
     """Verify SSE event parsing logic.
 
-    These tests validate the core JSON parsing behaviour used in event
-    handling, without requiring a live SSE connection.
+    These tests drive the bytes-level frame parser used by the event
+    generators directly, without requiring a live SSE connection.
     """
 
+    @staticmethod
+    def _parse(raw: bytes) -> list[dict]:
+        parser = _FrameParser()
+        return parser.feed(raw) + parser.close()
+
     def test_parse_valid_sse_data(self) -> None:
         """Simulate parsing a well-formed SSE data line."""
-        import json as _json
-
-        raw_lines = [
-            'data: {"type": "agent.spawned", "uid": "a1"}',
-            "",
-            'data: {"type": "agent.killed", "uid": "a2"}',
-            "",
-        ]
-
-        events: list[dict] = []
-        current_data = ""
-        for line in raw_lines:
-            if line.startswith("data: "):
-                current_data += line[6:]
-            elif line == "" and current_data:
-                try:
-                    events.append(_json.loads(current_data))
-                except _json.JSONDecodeError:
-                    pass
-                current_data = ""
+        events = self._parse(
+            b'data: {"type": "agent.spawned", "uid": "a1"}\n\n'
+            b'data: {"type": "agent.killed", "uid": "a2"}\n\n'
+        )
 
         assert len(events) == 2
         assert events[0]["type"] == "agent.spawned"
@@ -702,59 +1346,170 @@ class TestSSEEventParsing:
 
     def test_parse_malformed_sse_data_skipped(self) -> None:
         """Malformed JSON in SSE data lines should be skipped."""
-        import json as _json
-
-        raw_lines = [
-            "data: {bad json",
-            "",
-            'data: {"type": "valid"}',
-            "",
-        ]
-
-        events: list[dict] = []
-        current_data = ""
-        for line in raw_lines:
-            if line.startswith("data: "):
-                current_data += line[6:]
-            elif line == "" and current_data:
-                try:
-                    events.append(_json.loads(current_data))
-                except _json.JSONDecodeError:
-                    pass
-                current_data = ""
+        events = self._parse(b'data: {bad json\n\ndata: {"type": "valid"}\n\n')
 
         assert len(events) == 1
         assert events[0]["type"] == "valid"
 
     def test_parse_multiline_sse_data(self) -> None:
         """SSE data split across multiple 'data:' lines should be concatenated."""
-        import json as _json
-
-        raw_lines = [
-            'data: {"type": "big",',
-            'data:  "payload": "hello"}',
-            "",
-        ]
-
-        events: list[dict] = []
-        current_data = ""
-        for line in raw_lines:
-            if line.startswith("data: "):
-                current_data += line[6:]
-            elif line.startswith("data:"):
-                current_data += line[5:]
-            elif line == "" and current_data:
-                try:
-                    events.append(_json.loads(current_data))
-                except _json.JSONDecodeError:
-                    pass
-                current_data = ""
+        events = self._parse(b'data: {"type": "big",\ndata:  "payload": "hello"}\n\n')
 
         assert len(events) == 1
         assert events[0]["type"] == "big"
         assert events[0]["payload"] == "hello"
 
 
+class TestSubscribeEvents:
+    """Verify the SSE generator against a mocked event stream."""
+
+    @respx.mock
+    def test_subscribe_yields_parsed_events(self) -> None:
+        stream = (
+            'data: {"type": "agent.spawned", "uid": "a1"}\n\n'
+            "data: {bad json\n\n"
+            'data: {"type": "agent.killed", "uid": "a2"}\n\n'
+        )
+        route = respx.get(f"{BASE_URL}/api/v1/events").mock(
+            return_value=httpx.Response(
+                200,
+                text=stream,
+                headers={"Content-Type": "text/event-stream"},
+            )
+        )
+
+        events = list(
+            subscribe_events(BASE_URL, token="t", filter=["agent.spawned", "agent.killed"])
+        )
+
+        request = route.calls.last.request
+        assert request.url.params["filter"] == "agent.spawned,agent.killed"
+        assert request.headers["Authorization"] == "Bearer t"
+        assert [e["uid"] for e in events] == ["a1", "a2"]
+
+    @respx.mock
+    def test_subscribe_strips_trailing_slashes(self) -> None:
+        route = respx.get(f"{BASE_URL}/api/v1/events").mock(
+            return_value=httpx.Response(
+                200, text="", headers={"Content-Type": "text/event-stream"}
+            )
+        )
+
+        assert list(subscribe_events(f"{BASE_URL}//")) == []
+        assert route.calls.last.request.url.path == "/api/v1/events"
+
+    @respx.mock
+    def test_client_subscribe_uses_client_pool(self, client: AetherClient) -> None:
+        route = respx.get(f"{BASE_URL}/api/v1/events").mock(
+            return_value=httpx.Response(
+                200,
+                text='data: {"type": "agent.spawned"}\n\n',
+                headers={"Content-Type": "text/event-stream"},
+            )
+        )
+
+        events = list(client.events.subscribe(("agent.spawned", "agent.killed")))
+
+        assert events == [{"type": "agent.spawned"}]
+        request = route.calls.last.request
+        assert request.url.params["filter"] == "agent.spawned,agent.killed"
+        assert request.headers["Authorization"] == "Bearer test-token-123"
+        assert not client._http.is_closed
+
+    @respx.mock
+    def test_subscribe_handles_comments_crlf_and_multiline_data(self) -> None:
+        stream = (
+            b": heartbeat\r\n\r\n"
+            b"event: agent.spawned\r\n"
+            b'data: {"type": "agent.spawned",\r\n'
+            b'data:  "uid": "a1"}\r\n\r\n'
+            b'data: {"uid": "a2"}'
+        )
+        respx.get(f"{BASE_URL}/api/v1/events").mock(
+            return_value=httpx.Response(
+                200,
+                content=stream,
+                headers={"Content-Type": "text/event-stream"},
+            )
+        )
+
+        events = list(subscribe_events(BASE_URL))
+
+        assert events == [{"type": "agent.spawned", "uid": "a1"}, {"uid": "a2"}]
+
+    def test_frame_parser_handles_split_chunks(self) -> None:
+        raw = b'data: {"n": 1}\r\n\r\ndata: {"n": 2}\n\n'
+        parser = _FrameParser()
+        events = [e for i in range(len(raw)) for e in parser.feed(raw[i : i + 1])]
+        events += parser.close()
+
+        assert events == [{"n": 1}, {"n": 2}]
+
+    @pytest.mark.parametrize("size", [1, 2, 3, 7])
+    def test_frame_parser_mixed_line_endings_in_chunks(self, size: int) -> None:
+        raw = (
+            b'data: {"n": 1}\r\rdata: {"n": 2}\r\n\n'
+            b'data: {"n": 3}\n\r\ndata: {"n": 4}\r'
+        )
+        parser = _FrameParser()
+        events = [
+            e for i in range(0, len(raw), size) for e in parser.feed(raw[i : i + size])
+        ]
+        events += parser.close()
+
+        assert events == [{"n": 1}, {"n": 2}, {"n": 3}, {"n": 4}]
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_subscribe_batched(self, async_client: AetherAsyncClient) -> None:
+        stream = "".join(f'data: {{"n": {n}}}\n\n' for n in range(5))
+        respx.get(f"{BASE_URL}/api/v1/events").mock(
+            return_value=httpx.Response(
+                200,
+                text=stream,
+                headers={"Content-Type": "text/event-stream"},
+            )
+        )
+
+        batches = [
+            batch
+            async for batch in async_client.events.subscribe_batched(
+                batch_size=2, max_wait_ms=60_000
+            )
+        ]
+
+        assert [[e["n"] for e in b] for b in batches] == [[0, 1], [2, 3], [4]]
+
+    @pytest.mark.asyncio
+    async def test_batch_flushed_while_stream_idle(self) -> None:
+        async def bursty() -> AsyncIterator[list[dict]]:
+            yield [{"n": 0}]
+            await asyncio.sleep(0.5)
+            yield [{"n": 1}, {"n": 2}, {"n": 3}]
+
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        arrivals = []
+        async for batch in _batch_events(bursty(), 2, 20):
+            arrivals.append(([e["n"] for e in batch], loop.time() - started))
+
+        assert [events for events, _ in arrivals] == [[0], [1, 2], [3]]
+        assert arrivals[0][1] < 0.25
+
+    @pytest.mark.asyncio
+    async def test_batch_stream_error_propagates(self) -> None:
+        async def failing() -> AsyncIterator[list[dict]]:
+            yield [{"n": 0}, {"n": 1}, {"n": 2}]
+            raise httpx.ReadError("connection lost")
+
+        batches = []
+        with pytest.raises(httpx.ReadError):
+            async for batch in _batch_events(failing(), 2, 60_000):
+                batches.append([e["n"] for e in batch])
+
+        assert batches == [[0, 1]]
+
+
 # ---------------------------------------------------------------------------
 # Marketplace namespace
 # ---------------------------------------------------------------------------
@@ -763,6 +1518,17 @@ class TestSSEEventParsing:
 class TestMarketplaceNamespace:
     """Verify marketplace namespace endpoints."""
 
+    @respx.mock
+    def test_marketplace_templates_list_tags(self, client: AetherClient) -> None:
+        route = respx.get(f"{BASE_URL}/api/v1/marketplace/templates").mock(
+            return_value=httpx.Response(200, json={"data": []})
+        )
+
+        client.marketplace.templates.list(tags=["nlp", "ops"])
+        client.marketplace.templates.list(tags="nlp,ops")
+
+        assert [c.request.url.params["tags"] for c in route.calls] == ["nlp,ops"] * 2
+
     @respx.mock
     def test_marketplace_templates_list(self, client: AetherClient) -> None:
         respx.get(f"{BASE_URL}/api/v1/marketplace/templates").mock(